@@ -1,7 +1,38 @@
+import hmac
+import html
+import logging
+import os
+import sqlite3
+import uuid
+
 import streamlit as st
-import pandas as pd
-import plotly.graph_objects as go
-import numpy as np
+
+# 가벼운 순수 파이썬 모듈만 최상단에서 import
+# (plotly는 STEP 2, numpy 기반 추천 엔진은 STEP 3에서 필요할 때 불러옴 -> 콜드 스타트 단축)
+from compass.loader import CatalogStore
+from compass.holland import holland_code, tally
+from compass.profiling import NULL_PROFILER, Profiler
+from compass.render import PART_SIZE
+from compass.results import ResultStore
+from compass.values import normalize_weights
+
+# STEP 1 문항 렌더링 방식: compact(기본, 요소 수 최소화) | paged(파트별 페이지) | classic(기존 방식)
+FORM_MODE = os.environ.get('COMPASS_FORM_MODE', 'compact')
+# STEP 2 레이더 차트: patch(기본, 세션당 한 번 만든 그림의 r 값만 교체) | rebuild(매번 새로 생성)
+RADAR_MODE = os.environ.get('COMPASS_RADAR_MODE', 'patch')
+# 카탈로그 파일 위치 (questions.csv, jobs.csv, career_guide.json)
+DATA_DIR = os.environ.get('COMPASS_DATA_DIR', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data'))
+# 검사 결과 저장 파일 (빈 값이면 저장하지 않음)
+# 편집자가 동기화하고 배포 이미지에 포함되는 data/ 대신 별도 상태 폴더에 둠 (재배포해도 유지, 읽기 전용 배포에서도 저장)
+STATE_DIR = os.environ.get('COMPASS_STATE_DIR') or os.path.join(
+    os.environ.get('XDG_STATE_HOME') or os.path.join(os.path.expanduser('~'), '.local', 'state'), 'career-compass'
+)
+RESULTS_DB = os.environ.get('COMPASS_RESULTS_DB', os.path.join(STATE_DIR, 'results.sqlite'))
+# 반별 대시보드(?view=cohort) 접속 암호 (설정하지 않으면 대시보드를 열 수 없음)
+TEACHER_TOKEN = os.environ.get('COMPASS_TEACHER_TOKEN', '')
+# 구간별 시간 측정: COMPASS_PROFILE=1 (COMPASS_PROFILE_FILE=경로 이면 Prometheus 텍스트 파일로도 내보냄)
+PROFILE = os.environ.get('COMPASS_PROFILE') == '1'
+PROFILE_FILE = os.environ.get('COMPASS_PROFILE_FILE')
 
 # -----------------------------------------------------------------------------
 # 1. 페이지 설정 & 스타일
@@ -13,8 +44,17 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# 프로세스 공용 측정기 (꺼져 있으면 아무것도 하지 않는 NULL_PROFILER)
+@st.cache_resource
+def load_profiler():
+    return Profiler(export_path=PROFILE_FILE)
+
+profiler = load_profiler() if PROFILE else NULL_PROFILER
+prof = profiler.rerun(st.session_state.get('step', 1))
+
 # UI/UX 스타일링
-st.markdown("""
+with prof.section('css'):
+    st.markdown("""
 <style>
     .main-header { font-size: 2.2rem; font-weight: 700; color: #1E3A8A; margin-bottom: 1rem; }
     .sub-header { font-size: 1.1rem; color: #64748B; margin-bottom: 2rem; }
@@ -23,6 +63,7 @@ st.markdown("""
     .tag-base { display: inline-block; padding: 4px 10px; border-radius: 15px; font-size: 0.85rem; font-weight: 600; margin: 3px; }
     .tag-gen { background-color: #DBEAFE; color: #1E40AF; border: 1px solid #BFDBFE; }
     .tag-career { background-color: #FEF3C7; color: #92400E; border: 1px solid #FDE68A; }
+    div[data-testid="stForm"] div[data-testid="stRadio"] { margin-bottom: 1.5rem; }
     .step-indicator { padding: 8px 16px; background-color: #EFF6FF; border-radius: 20px; color: #1D4ED8; font-weight: bold; margin-bottom: 15px; display: inline-block; }
 </style>
 """, unsafe_allow_html=True)
@@ -30,94 +71,90 @@ st.markdown("""
 # -----------------------------------------------------------------------------
 # 2. 데이터 센터 (구글 시트 질문 + 직업 데이터)
 # -----------------------------------------------------------------------------
-@st.cache_data
-def load_data():
-    # 1. 구글 시트 질문 데이터 (하드코딩 - 연동 실패 시 안전장치)
-    # 실제로는 gsheets connection을 쓰면 좋지만, 여기서는 요청하신 데이터를 그대로 넣었습니다.
-    questions = [
-        {"id": "Q1", "text": "드론, 3D 프린터 등 새로운 기계를 조작하고 결과물을 만드는 것이 즐겁다.", "type": "R"},
-        {"id": "Q2", "text": "가구 조립이나 전자제품 수리처럼 손끝의 감각을 사용하는 일을 잘한다.", "type": "R"},
-        {"id": "Q3", "text": "실내에 앉아있는 것보다 야외에서 몸을 움직이며 땀 흘리는 활동을 선호한다.", "type": "R"},
-        {"id": "Q4", "text": "식물을 키우거나 동물을 돌보는 등 생명체를 다루는 일에 관심이 있다.", "type": "R"},
-        {"id": "Q5", "text": "복잡한 설계도나 지도를 보고 입체적인 구조를 파악하는 것이 빠르다.", "type": "R"},
-        {"id": "Q6", "text": "운동 경기에서 전략보다는 신체적인 능력과 기술을 발휘하는 포지션이 좋다.", "type": "R"},
-        {"id": "Q7", "text": "사회 이슈나 자연 현상을 볼 때 '근본적인 원인'이 무엇인지 분석하려 한다.", "type": "I"},
-        {"id": "Q8", "text": "수학 난제나 추리 소설의 범인을 찾을 때까지 끈질기게 파고든다.", "type": "I"},
-        {"id": "Q9", "text": "객관적인 데이터와 통계 자료를 근거로 주장하는 것을 선호한다.", "type": "I"},
-        {"id": "Q10", "text": "인공지능, 우주, 뇌과학 등 미지의 영역을 탐구하는 다큐멘터리를 즐겨 본다.", "type": "I"},
-        {"id": "Q11", "text": "실험을 통해 가설을 검증하고 새로운 사실을 발견했을 때 희열을 느낀다.", "type": "I"},
-        {"id": "Q12", "text": "논리적 모순을 찾아내거나 비판적으로 사고하는 토론 수업이 재미있다.", "type": "I"},
-        {"id": "Q13", "text": "정해진 양식보다는 나만의 스타일로 PPT나 보고서를 꾸미는 것을 좋아한다.", "type": "A"},
-        {"id": "Q14", "text": "글, 그림, 영상, 음악 등을 통해 나의 감정을 표현하는 것이 익숙하다.", "type": "A"},
-        {"id": "Q15", "text": "남들이 생각하지 못한 기발한 아이디어로 친구들을 놀라게 한 적이 있다.", "type": "A"},
-        {"id": "Q16", "text": "자유로운 분위기에서 상상력을 발휘할 수 있는 환경을 선호한다.", "type": "A"},
-        {"id": "Q17", "text": "영화나 소설을 볼 때 등장인물의 감정에 깊이 이입하여 눈물을 흘리곤 한다.", "type": "A"},
-        {"id": "Q18", "text": "유행을 따르기보다 나만의 개성이 드러나는 옷이나 소품을 좋아한다.", "type": "A"},
-        {"id": "Q19", "text": "친구의 고민을 들어주고 그들의 감정을 위로해 주는 데서 보람을 느낀다.", "type": "S"},
-        {"id": "Q20", "text": "어려운 개념을 친구들이 이해하기 쉽게 설명해 주는 것을 잘한다.", "type": "S"},
-        {"id": "Q21", "text": "봉사활동이나 멘토링처럼 타인의 성장을 돕는 활동에 적극적이다.", "type": "S"},
-        {"id": "Q22", "text": "혼자 일하는 것보다 팀원들과 협력하여 시너지를 내는 것을 선호한다.", "type": "S"},
-        {"id": "Q23", "text": "사회적 약자나 인권 문제에 관심이 많고 이를 개선하고 싶다.", "type": "S"},
-        {"id": "Q24", "text": "낯선 사람과도 금방 친해지고 대화를 이끌어가는 사교성이 있다.", "type": "S"},
-        {"id": "Q25", "text": "학급 회장이나 동아리 대표처럼 리더십을 발휘하는 자리가 편하다.", "type": "E"},
-        {"id": "Q26", "text": "목표를 달성하기 위해 사람들을 설득하고 협상하는 과정이 즐겁다.", "type": "E"},
-        {"id": "Q27", "text": "실패를 두려워하기보다 도전적인 과제에 부딪혀 성취하는 것을 즐긴다.", "type": "E"},
-        {"id": "Q28", "text": "나의 노력에 따라 보상이 확실하게 주어지는 경쟁적인 환경을 선호한다.", "type": "E"},
-        {"id": "Q29", "text": "경제 흐름, 창업, 마케팅 전략 등 비즈니스 세계에 관심이 많다.", "type": "E"},
-        {"id": "Q30", "text": "대중 앞에서 나의 의견을 발표하고 주목받는 것을 즐긴다.", "type": "E"},
-        {"id": "Q31", "text": "계획을 세워 시간과 돈을 체계적으로 관리하는 습관이 있다.", "type": "C"},
-        {"id": "Q32", "text": "문서의 오타를 찾거나 숫자를 정확하게 계산하는 꼼꼼함이 있다.", "type": "C"},
-        {"id": "Q33", "text": "정해진 규칙과 매뉴얼을 준수하며 안정적으로 일하는 것을 선호한다.", "type": "C"},
-        {"id": "Q34", "text": "복잡한 자료를 보기 좋게 정리하고 분류하는 것을 잘한다.", "type": "C"},
-        {"id": "Q35", "text": "예측 불가능한 모험보다는 확실하고 안전한 선택을 하는 편이다.", "type": "C"},
-        {"id": "Q36", "text": "책임감이 강하고 맡은 일은 끝까지 성실하게 마무리한다.", "type": "C"},
-    ]
-    
-    # 2. 직업 데이터
-    df_jobs = pd.DataFrame({
-        '직업군': [
-            '소프트웨어 개발자', '데이터 사이언티스트', '정보보안 전문가', 'AI 연구원', '반도체 엔지니어',
-            '의사 (전문의)', '약사', '간호사', '수의사', '치과의사',
-            '경영 컨설턴트', '공인회계사(CPA)', '투자은행가(IB)', '마케팅 전문가', '관세사',
-            '변호사 (로스쿨)', '판사/검사', '변리사', '노무사', '경찰공무원',
-            '5급 행정고시', '7/9급 공무원', '외교관', '중등 교사', '대학교수',
-            '방송 PD', '기자', '웹툰 작가', '큐레이터', '항공기 조종사'
-        ],
-        'Holland_Code': [
-            'IR', 'IC', 'IC', 'IR', 'RI',
-            'IS', 'SC', 'SI', 'IR', 'IR',
-            'EC', 'CE', 'EC', 'AE', 'CE',
-            'EI', 'EI', 'IE', 'ES', 'SE',
-            'ES', 'CS', 'SA', 'SA', 'IA',
-            'AE', 'EI', 'AI', 'AE', 'RI'
-        ],
-        'Money': [45, 50, 45, 50, 50, 60, 45, 35, 45, 55, 55, 50, 60, 35, 40, 55, 50, 50, 40, 30, 35, 25, 40, 30, 40, 35, 30, 40, 25, 55],
-        'WLB':   [25, 25, 20, 20, 15, 10, 35, 15, 25, 25, 5, 10, 5, 25, 30, 5, 10, 15, 30, 15, 15, 35, 15, 35, 35, 5, 5, 20, 30, 20],
-        'Culture':[35, 30, 25, 25, 15, 10, 15, 10, 15, 15, 10, 15, 5, 40, 15, 10, 5, 15, 20, 5, 10, 10, 15, 15, 20, 30, 20, 40, 25, 10],
-        'Location':[15, 15, 15, 10, 10, 20, 20, 25, 20, 20, 25, 25, 25, 20, 20, 25, 20, 20, 20, 10, 30, 15, 10, 15, 10, 25, 20, 10, 20, 10],
-        'Stability':[20, 25, 30, 25, 30, 60, 50, 40, 50, 55, 15, 40, 10, 15, 40, 30, 50, 45, 35, 50, 55, 60, 50, 55, 50, 20, 25, 10, 20, 40]
-    })
-    
-    # 3. 상세 진로 가이드 (일부 예시)
-    guide = {
-        "소프트웨어 개발자": {"major": "컴퓨터공학, 소프트웨어학", "hs_g": "수학I/II, 미적분, 물리학I, 정보", "hs_c": "인공지능 수학, 정보과학", "steps": ["CS 기초(자료구조/알고리즘)", "나만의 웹/앱 프로젝트 배포", "코딩테스트 및 기술면접"]},
-        "데이터 사이언티스트": {"major": "통계학, 산업공학, 데이터사이언스", "hs_g": "확률과 통계, 미적분, 사회문제탐구", "hs_c": "실용 통계, 수학과제 탐구", "steps": ["Python/SQL 및 통계학 마스터", "Kaggle 등 분석 대회 참여", "석사 진학 또는 실무 프로젝트"]},
-        "의사 (전문의)": {"major": "의예과", "hs_g": "생명과학I, 화학I, 미적분", "hs_c": "생명과학II, 화학II", "steps": ["의대 6년(예과+본과)", "의사 국가고시 합격", "인턴 1년 + 레지던트 3~4년"]},
-        "경영 컨설턴트": {"major": "경영학, 경제학, 산업공학", "hs_g": "경제, 사회문화, 영어회화", "hs_c": "국제 경제, 사회문제 탐구", "steps": ["전략 학회 활동 및 공모전", "RA(Research Assistant) 인턴", "Case Interview 준비"]},
-        "5급 행정고시": {"major": "행정학, 경제학, 정치외교", "hs_g": "정치와 법, 한국사, 경제", "hs_c": "국제 정치, 지역 이해", "steps": ["PSAT(1차) 및 한국사/영어", "2차 전공 논술(경제/행정법)", "3차 심층 면접"]},
-        "반도체 엔지니어": {"major": "전자공학, 신소재공학", "hs_g": "물리학I/II, 화학I, 미적분", "hs_c": "공학 일반, 고급 물리학", "steps": ["회로이론/반도체공학 학점 관리", "반도체 공정 실습 경험", "대기업 직무적성검사(GSAT 등)"]},
-        "공인회계사(CPA)": {"major": "경영학, 회계학, 세무학", "hs_g": "경제, 확률과 통계", "hs_c": "경제 수학, 실용 경제", "steps": ["학점 이수 및 토익 점수 확보", "1차 시험(객관식)", "2차 시험(서술형)"]},
-        "변호사 (로스쿨)": {"major": "자유전공, 정치외교, 경제", "hs_g": "정치와 법, 생활과 윤리, 화작", "hs_c": "사회문제 탐구, 고전 읽기", "steps": ["학점(GPA) 및 토익 고득점", "LEET(법학적성시험) 준비", "로스쿨 3년 + 변호사 시험"]},
-        "중등 교사": {"major": "사범대학(해당 전공)", "hs_g": "교육학(선택), 전공 관련 과목", "hs_c": "교육학, 심리학", "steps": ["교원 자격증 취득", "임용고시 1차(교육학/전공)", "임용고시 2차(수업실연/면접)"]},
-        "방송 PD": {"major": "신문방송학, 미디어커뮤니케이션", "hs_g": "언어와 매체, 사회문화", "hs_c": "매체와 비평, 영상 제작", "steps": ["영상 제작 경험(동아리/유튜브)", "작문/논술(언론고시) 준비", "실무 면접 및 기획안 평가"]},
-        "약사": {"major": "약학과", "hs_g": "화학I, 생명과학I, 미적분", "hs_c": "화학II, 융합과학 탐구", "steps": ["약대 6년 과정 입학", "약학 필수 실무 실습", "약사 면허 시험 합격"]},
-        "간호사": {"major": "간호학과", "hs_g": "생명과학I, 생활과 윤리", "hs_c": "보건 간호, 인체 구조와 기능", "steps": ["간호학과 4년 졸업", "간호사 국가고시 합격", "대학병원/종합병원 취업"]},
-        "항공기 조종사": {"major": "항공운항학과", "hs_g": "물리학I, 지구과학I, 영어", "hs_c": "고급 지구과학", "steps": ["비행 교육원 입교 및 면장 취득", "비행 시간(타임빌딩) 축적", "항공사 입사"]},
-    }
-    
-    return questions, df_jobs, guide
+# 카탈로그는 프로세스당 한 번만 만들어 모든 세션이 읽기 전용으로 공유
+# (st.cache_data는 rerun마다 복사본을 만들기 때문에 st.cache_resource 사용)
+# 질문/직업/가이드는 data/ 폴더 파일에서 읽고(없으면 내장 데이터), 파일이 바뀌면 자동으로 교체
+@st.cache_resource
+def load_catalog_store():
+    profiler.cache_miss('catalog_store')
+    # COMPASS_WARMUP=1 이면 자주 쓰는 추천 결과를 백그라운드에서 미리 계산
+    on_load = (lambda catalog: catalog.warm_up()) if os.environ.get('COMPASS_WARMUP') == '1' else None
+    store = CatalogStore(DATA_DIR, on_load=on_load)
+    profiler.add_collector(lambda: store.get().cache_stats())
+    return store
+
+with prof.section('catalog'):
+    profiler.cache_request('catalog_store')
+    catalog = load_catalog_store().get()
+questions = catalog.questions
+
+# 완료한 검사 결과는 반(cohort)별로 SQLite에 저장 (기록은 백그라운드 스레드가 모아서 처리)
+@st.cache_resource
+def load_result_store():
+    if not RESULTS_DB:
+        return None
+    try:
+        os.makedirs(os.path.dirname(os.path.abspath(RESULTS_DB)), exist_ok=True)
+        return ResultStore(RESULTS_DB)
+    except (sqlite3.Error, OSError):
+        # 읽기 전용 배포 등으로 파일을 열 수 없으면 저장 없이 계속 (대시보드는 '저장이 꺼져 있음' 표시)
+        logging.getLogger(__name__).warning("cannot open result store %s, results will not be saved", RESULTS_DB, exc_info=True)
+        return None
 
-questions, df_jobs, career_guide = load_data()
+results = load_result_store()
+# 반 구분은 선생님이 나눠 준 링크의 ?cohort=3-2 값 사용
+cohort = st.query_params.get('cohort', '').strip()[:40]
+
+# -----------------------------------------------------------------------------
+# 반별 결과 대시보드 (?view=cohort&cohort=3-2, 선생님 암호 필요)
+# -----------------------------------------------------------------------------
+if st.query_params.get('view') == 'cohort':
+    st.markdown("<h1 class='main-header'>📊 반별 검사 결과</h1>", unsafe_allow_html=True)
+    # 학생 개인 점수가 드러날 수 있으므로(인원이 적은 반) 암호를 입력한 세션에만 표시
+    if not TEACHER_TOKEN:
+        st.warning("대시보드가 꺼져 있습니다. (COMPASS_TEACHER_TOKEN)")
+        st.stop()
+    if not st.session_state.get('teacher_ok'):
+        token = st.text_input("선생님 암호", type="password")
+        if not token:
+            st.stop()
+        if not hmac.compare_digest(token.encode(), TEACHER_TOKEN.encode()):
+            st.error("암호가 올바르지 않습니다.")
+            st.stop()
+        st.session_state.teacher_ok = True
+    if results is None:
+        st.warning("결과 저장이 꺼져 있습니다. (COMPASS_RESULTS_DB)")
+        st.stop()
+
+    cohort_names = [name for name, _ in results.cohorts()]
+    if not cohort_names:
+        st.info("아직 저장된 결과가 없습니다.")
+        st.stop()
+    target_cohort = st.selectbox(
+        "반 선택",
+        cohort_names,
+        index=cohort_names.index(cohort) if cohort in cohort_names else 0,
+        format_func=lambda name: name or "(반 미지정)"
+    )
+    summary = results.summary(target_cohort)
+
+    st.metric("검사 완료 인원", f"{summary.sessions}명")
+    col_scores, col_values = st.columns([1, 1])
+    with col_scores:
+        st.markdown("### 🧩 RIASEC 평균 점수")
+        st.bar_chart(summary.scores)
+    with col_values:
+        st.markdown("### ⚖️ 가치관 평균 비중")
+        st.bar_chart(summary.values)
+
+    col_codes, col_jobs = st.columns([1, 2])
+    with col_codes:
+        st.markdown("### 🏷️ 홀란드 코드 분포")
+        st.dataframe([{"코드": f"{code}형", "인원": n} for code, n in summary.codes], hide_index=True)
+    with col_jobs:
+        st.markdown("### 🏆 많이 추천된 직업")
+        st.dataframe([{"직업": job, "TOP 5 추천": n, "최종 선택": selected} for job, n, selected in summary.jobs], hide_index=True)
+    st.stop()
 
 # -----------------------------------------------------------------------------
 # 3. 사이드바 (상태 관리)
@@ -125,31 +162,51 @@ questions, df_jobs, career_guide = load_data()
 if 'step' not in st.session_state:
     st.session_state.step = 1
 
-with st.sidebar:
+with st.sidebar, prof.section('sidebar'):
     st.header("🧭 진행 상황")
     
     if st.session_state.step == 1:
         st.markdown("<div class='step-indicator'>STEP 1. 정밀 적성 검사</div>", unsafe_allow_html=True)
-        st.info("36개의 문항에 답하여 나의 적성을 분석합니다.")
+        st.info(f"{len(questions)}개의 문항에 답하여 나의 적성을 분석합니다.")
         # 진행률 표시
         if 'responses' in st.session_state:
             answered = len(st.session_state.responses)
-            st.progress(answered / 36)
-            st.caption(f"진행률: {answered}/36")
+            st.progress(answered / len(questions))
+            st.caption(f"진행률: {answered}/{len(questions)}")
     elif st.session_state.step == 2:
         st.markdown("<div class='step-indicator'>STEP 2. 가치관 설정</div>", unsafe_allow_html=True)
         st.info("직업 선택 시 무엇을 중요하게 생각하시나요?")
     else:
         st.markdown("<div class='step-indicator'>STEP 3. 결과 확인</div>", unsafe_allow_html=True)
         st.success("분석 완료! 추천 직업과 상세 로드맵을 확인하세요.")
+        if results is not None:
+            st.caption("검사 결과가 저장되었습니다." + (f" (반: {cohort})" if cohort else ""))
         if st.button("🔄 처음부터 다시 하기"):
             st.session_state.step = 1
             st.session_state.responses = {}
+            st.session_state.form_page = 0
             st.rerun()
             
     st.divider()
     st.caption("Created by Plant the Seed 🌱")
 
+    # 관리자 패널 (COMPASS_PROFILE=1 이고 ?admin=1 일 때만 표시)
+    if profiler.enabled and st.query_params.get('admin') == '1':
+        with st.expander("⏱️ 성능 측정 (관리자)"):
+            st.caption("마지막 rerun (ms)")
+            st.dataframe([{"구간": name, "ms": round(sec * 1000, 2)} for name, sec in st.session_state.get('last_rerun_profile', [])], hide_index=True)
+            st.caption("구간별 최근 분위수 (ms)")
+            st.dataframe([
+                {"구간": name, "STEP": step, "횟수": count,
+                 **{f"p{int(q * 100)}": round(v * 1000, 2) for q, v in quantiles.items()}}
+                for name, step, count, total, quantiles in profiler.summary()
+            ], hide_index=True)
+            st.caption("캐시 적중률")
+            st.dataframe([
+                {"캐시": name, "적중": hits, "miss": misses, "적중률": f"{hits / ((hits + misses) or 1):.1%}"}
+                for name, hits, misses in profiler.cache_stats()
+            ], hide_index=True)
+
 # -----------------------------------------------------------------------------
 # 4. 메인 콘텐츠
 # -----------------------------------------------------------------------------
@@ -167,49 +224,76 @@ if st.session_state.step == 1:
 
     # 36개 질문을 탭이나 페이지로 나누지 않고 한 번에 스크롤로 보여줌 (사용성 고려)
     # 너무 길어지는 것을 방지하기 위해 6개씩 끊어서 Expander로 보여주거나, 그대로 나열
+    # COMPASS_FORM_MODE=paged 이면 파트(6문항)별로 나눠서 한 페이지씩 보여줌
+    paged = FORM_MODE == 'paged'
+    n_pages = (len(questions) + PART_SIZE - 1) // PART_SIZE
+    page = st.session_state.get('form_page', 0) if paged else 0
+    shown = range(page * PART_SIZE, min((page + 1) * PART_SIZE, len(questions))) if paged else range(len(questions))
+    submit_button = prev_button = next_button = False
     
     # RIASEC 유형별 점수 계산을 위해 폼 사용
-    with st.form("holland_form"):
-        # 6개씩 그룹지어 보여주기 (R, I, A, S, E, C 순서대로 되어있음)
-        types = ['R (현실형)', 'I (탐구형)', 'A (예술형)', 'S (사회형)', 'E (진취형)', 'C (관습형)']
-        
-        for i, q in enumerate(questions):
-            # 6문제마다 헤더 출력 (유형 구분을 위해)
-            if i % 6 == 0:
-                type_idx = i // 6
-                st.markdown(f"### 📌 Part {type_idx + 1}")
-            
-            st.markdown(f"""
-            <div class="question-box">
-                <b>Q{i+1}.</b> {q['text']}
-            </div>
-            """, unsafe_allow_html=True)
-            
-            # 라디오 버튼을 가로로 배치하여 1~5점 선택
-            st.radio(
-                label=f"Q{i+1} 응답",
-                options=[1, 2, 3, 4, 5],
-                index=2, # 기본값 3점
-                horizontal=True,
-                key=f"q_{q['id']}", # 고유 키
-                label_visibility="collapsed"
-            )
-            st.write("") # 간격
-
-        submit_button = st.form_submit_button("검사 완료 및 다음 단계 ➡️", type="primary")
+    with st.form("holland_form"), prof.section('step1.form'):
+        if FORM_MODE == 'classic':
+            # 6개씩 그룹지어 보여주기 (R, I, A, S, E, C 순서대로 되어있음)
+            for i, q in enumerate(questions):
+                # 6문제마다 헤더 출력 (유형 구분을 위해)
+                if i % 6 == 0:
+                    type_idx = i // 6
+                    st.markdown(f"### 📌 Part {type_idx + 1}")
+                
+                st.markdown(f"""
+                <div class="question-box">
+                    <b>Q{i+1}.</b> {html.escape(q['text'])}
+                </div>
+                """, unsafe_allow_html=True)
+                
+                # 라디오 버튼을 가로로 배치하여 1~5점 선택
+                st.radio(
+                    label=f"Q{i+1} 응답",
+                    options=[1, 2, 3, 4, 5],
+                    index=2, # 기본값 3점
+                    horizontal=True,
+                    key=f"q_{q['id']}", # 고유 키
+                    label_visibility="collapsed"
+                )
+                st.write("") # 간격
+        else:
+            # 문항 HTML은 프로세스당 한 번만 만들어 재사용, 파트 헤더는 문항 HTML에 포함, 간격은 CSS로 처리
+            blocks = catalog.question_blocks
+            for i in shown:
+                q = questions[i]
+                st.markdown(blocks[i], unsafe_allow_html=True)
+                st.radio(
+                    label=f"Q{i+1} 응답",
+                    options=[1, 2, 3, 4, 5],
+                    index=st.session_state.responses.get(q['id'], 3) - 1, # 이전 페이지에서 고른 값 유지 (기본 3점)
+                    horizontal=True,
+                    key=f"q_{q['id']}",
+                    label_visibility="collapsed"
+                )
+
+        if paged and page > 0:
+            prev_button = st.form_submit_button("⬅️ 이전 파트")
+        if paged and page < n_pages - 1:
+            next_button = st.form_submit_button("다음 파트 ➡️", type="primary")
+        else:
+            submit_button = st.form_submit_button("검사 완료 및 다음 단계 ➡️", type="primary")
+
+    if prev_button or next_button:
+        # 화면에서 사라지는 라디오 값은 responses에 옮겨 두기 (사이드바 진행률에도 반영)
+        for i in shown:
+            q = questions[i]
+            st.session_state.responses[q['id']] = st.session_state[f"q_{q['id']}"]
+        st.session_state.form_page = page + (1 if next_button else -1)
+        st.rerun()
 
     if submit_button:
-        # 점수 계산
-        scores = {'R': 0, 'I': 0, 'A': 0, 'S': 0, 'E': 0, 'C': 0}
+        # 점수 계산 (session_state에서 q_Q1.. 응답 값 가져오기)
+        answers = {q['id']: st.session_state.get(f"q_{q['id']}", st.session_state.responses.get(q['id'], 3)) for q in questions}
+        scores = tally(answers, questions)
         
-        for q in questions:
-            # session_state에서 값 가져오기
-            val = st.session_state.get(f"q_{q['id']}", 3)
-            scores[q['type']] += val
-            
         # 상위 2개 유형 추출
-        sorted_scores = sorted(scores.items(), key=lambda x: x[1], reverse=True)
-        top_code = sorted_scores[0][0] + sorted_scores[1][0]
+        top_code = holland_code(scores)
         
         st.session_state.holland_code = top_code
         st.session_state.holland_scores = scores
@@ -223,33 +307,56 @@ elif st.session_state.step == 2:
     st.markdown("<h1 class='main-header'>⚖️ STEP 2. 직업 가치관 밸런스</h1>", unsafe_allow_html=True)
     st.markdown(f"<p class='sub-header'>당신의 적성 유형은 <b>[{st.session_state.holland_code}형]</b> 입니다.<br>이제 직업 선택 시 중요하게 생각하는 요소의 비중을 정해주세요.</p>", unsafe_allow_html=True)
 
-    col_input, col_chart = st.columns([1, 1])
-    
-    with col_input:
-        v_money = st.slider("💰 **돈 (Money)** : 높은 연봉과 보상", 0, 100, 50)
-        v_wlb = st.slider("🧘 **워라밸 (WLB)** : 저녁이 있는 삶, 휴식", 0, 100, 50)
-        v_culture = st.slider("🎨 **문화 (Culture)** : 수평적이고 자유로운 분위기", 0, 100, 20)
-        v_loc = st.slider("📍 **근무지 (Location)** : 서울/수도권, 출퇴근 편의", 0, 100, 30)
-        v_stable = st.slider("🛡️ **안정성 (Stability)** : 정년 보장, 낮은 해고 위험", 0, 100, 50)
-
-    total = v_money + v_wlb + v_culture + v_loc + v_stable
-    if total == 0: total = 1
-    user_vec = [(x/total)*100 for x in [v_money, v_wlb, v_culture, v_loc, v_stable]]
-    st.session_state.user_vector = user_vec
-
-    with col_chart:
+    def radar_figure(user_vec):
+        import plotly.graph_objects as go
+
+        r = user_vec + [user_vec[0]]
+        # patch 모드: 세션마다 그림을 한 번만 만들고, 이후에는 r 값만 바꿔서 재사용
+        fig = st.session_state.get('radar_fig') if RADAR_MODE == 'patch' else None
+        if fig is not None:
+            fig.data[0].r = r
+            return fig
+
         fig = go.Figure(go.Scatterpolar(
-            r=user_vec + [user_vec[0]],
+            r=r,
             theta=['돈', '워라밸', '문화', '근무지', '안정성', '돈'],
             fill='toself',
             name='나의 가치관',
             line_color='#3B82F6'
         ))
         fig.update_layout(polar=dict(radialaxis=dict(visible=True, range=[0, 40])), showlegend=False, height=350, title="나의 가치관 다이아몬드")
-        st.plotly_chart(fig, use_container_width=True)
+        if RADAR_MODE == 'patch':
+            st.session_state.radar_fig = fig
+        return fig
+
+    # 슬라이더를 움직이면 이 부분(슬라이더 + 레이더 차트)만 다시 실행 (CSS/사이드바 등 전체 rerun 없음)
+    @st.fragment
+    def value_panel():
+        # 슬라이더 조작 시에는 이 함수만 다시 실행되므로 fragment 단위로 따로 측정
+        frag = profiler.rerun(2, name='step2.fragment')
+        col_input, col_chart = st.columns([1, 1])
+        
+        with col_input:
+            v_money = st.slider("💰 **돈 (Money)** : 높은 연봉과 보상", 0, 100, 50)
+            v_wlb = st.slider("🧘 **워라밸 (WLB)** : 저녁이 있는 삶, 휴식", 0, 100, 50)
+            v_culture = st.slider("🎨 **문화 (Culture)** : 수평적이고 자유로운 분위기", 0, 100, 20)
+            v_loc = st.slider("📍 **근무지 (Location)** : 서울/수도권, 출퇴근 편의", 0, 100, 30)
+            v_stable = st.slider("🛡️ **안정성 (Stability)** : 정년 보장, 낮은 해고 위험", 0, 100, 50)
+
+        weights = [v_money, v_wlb, v_culture, v_loc, v_stable]
+        user_vec = normalize_weights(weights)
+        st.session_state.value_weights = weights
+        st.session_state.user_vector = user_vec
+
+        with col_chart, frag.section('step2.chart'):
+            st.plotly_chart(radar_figure(user_vec), use_container_width=True)
+        frag.finish()
+
+    value_panel()
 
     if st.button("결과 분석 보기 🚀", type="primary"):
         st.session_state.step = 3
+        st.session_state.result_id = uuid.uuid4().hex  # 저장소의 결과 1건 (다시 분석하면 새 결과)
         st.rerun()
 
 # =============================================================================
@@ -258,28 +365,16 @@ elif st.session_state.step == 2:
 elif st.session_state.step == 3:
     st.markdown(f"<h1 class='main-header'>🎯 분석 결과: [{st.session_state.holland_code}형]</h1>", unsafe_allow_html=True)
     
-    # 1. 추천 알고리즘
-    def calc_score(row):
-        # 가치관 점수 (유클리드 거리)
-        job_vec = np.array([row['Money'], row['WLB'], row['Culture'], row['Location'], row['Stability']])
-        user_vec = np.array(st.session_state.user_vector)
-        value_match = 100 - np.linalg.norm(job_vec - user_vec)
-        
-        # 홀란드 보너스 (코드가 1개라도 겹치면 가산점)
-        holland_bonus = 0
-        if st.session_state.holland_code[0] in row['Holland_Code']: holland_bonus += 5
-        if st.session_state.holland_code[1] in row['Holland_Code']: holland_bonus += 3
-        
-        return value_match + holland_bonus
-
-    df_jobs['Score'] = df_jobs.apply(calc_score, axis=1)
-    top_jobs = df_jobs.sort_values('Score', ascending=False).head(5)
+    # 1. 추천 알고리즘 (가치관 유클리드 거리 + 홀란드 보너스, 전체 직업 일괄 계산)
+    # 같은 (홀란드 코드, 슬라이더 비율) 결과는 세션 공유 캐시에서 재사용
+    with prof.section('step3.top_k'):
+        top_idx = catalog.recommendations.top_k(st.session_state.holland_code, st.session_state.value_weights, k=5)
     
     # 2. 추천 직업 리스트
     st.markdown("### 🏆 당신을 위한 TOP 5 추천 직업")
     st.caption("아래 직업 중 하나를 선택하면 상세 로드맵이 펼쳐집니다.")
     
-    job_options = top_jobs['직업군'].tolist()
+    job_options = [str(catalog.jobs['직업군'][i]) for i in top_idx]
     
     # 세션 상태로 선택된 직업 유지
     if 'selected_job_final' not in st.session_state:
@@ -295,40 +390,45 @@ elif st.session_state.step == 3:
 
     # 3. 상세 로드맵 뷰
     target_job = st.session_state.selected_job_final
+
+    # 결과 저장 (처음 한 번 + 선택 직업이 바뀔 때만, 큐에 넣기만 하므로 rerun을 막지 않음)
+    # "처음부터 다시 하기"로 세션 값이 지워져도 저장된 결과는 남음
+    result_id = st.session_state.setdefault('result_id', uuid.uuid4().hex)
+    if results is not None and st.session_state.get('recorded_result') != (result_id, target_job):
+        results.submit({
+            'id': result_id,
+            'cohort': cohort,
+            'holland_code': st.session_state.holland_code,
+            'holland_scores': st.session_state.holland_scores,
+            'user_vector': st.session_state.user_vector,
+            'top_jobs': job_options,
+            'selected_job': target_job,
+        })
+        st.session_state.recorded_result = (result_id, target_job)
     
-    if target_job in career_guide:
-        info = career_guide[target_job]
+    # 가이드 HTML/로드맵 문구는 직업별로 한 번만 만들어 모든 세션이 공유 (없으면 인덱스 조회만)
+    with prof.section('step3.guide'):
+        guide = catalog.guides.rendered(target_job)
+    if guide is not None:
         
         st.markdown(f"## 🚩 **{target_job}** 마스터 플랜")
         
         # [A] 학과 및 고교학점제
-        c1, c2, c3 = st.columns(3)
-        with c1:
-            st.markdown(f"""<div class="info-box">
-                <span class="info-title">🎓 대학 전공 추천</span>
-                <p>{info['major']}</p>
-            </div>""", unsafe_allow_html=True)
-        
-        with c2:
-            tags = "".join([f"<span class='tag-base tag-gen'>{s}</span>" for s in info['hs_g'].split(', ')])
-            st.markdown(f"""<div class="info-box">
-                <span class="info-title">📘 고교 일반선택 과목</span>
-                {tags}
-            </div>""", unsafe_allow_html=True)
-            
-        with c3:
-            tags = "".join([f"<span class='tag-base tag-career'>{s}</span>" for s in info['hs_c'].split(', ')])
-            st.markdown(f"""<div class="info-box">
-                <span class="info-title">🚀 고교 진로선택 과목</span>
-                {tags}
-            </div>""", unsafe_allow_html=True)
+        for col, box in zip(st.columns(3), guide.boxes):
+            with col:
+                st.markdown(box, unsafe_allow_html=True)
             
         # [B] 단계별 로드맵
         st.write("")
         st.markdown("### 🛤️ 커리어 로드맵")
         
-        for idx, step_text in enumerate(info['steps']):
-            st.info(f"**STEP {idx+1}** : {step_text}")
+        for step_line in guide.steps:
+            st.info(step_line)
             
     else:
         st.warning("선택하신 직업의 상세 데이터가 준비 중입니다.")
+
+# rerun 전체 시간 기록 (st.rerun()으로 중간에 끝난 rerun은 구간 기록만 남음)
+prof.finish()
+if profiler.enabled:
+    st.session_state.last_rerun_profile = prof.sections
@@ -0,0 +1,92 @@
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+from streamlit.runtime.scriptrunner import RerunData
+from streamlit.testing.v1 import AppTest, local_script_runner
+
+# 벤치마크용 AppTest 보조 도구
+# - 매 rerun 마다 브라우저로 보내는 ForwardMsg 수/바이트 기록
+# - 실제 서버처럼 fragment 범위 rerun 요청 (AppTest는 기본적으로 항상 전체 rerun)
+#   (rerun 요청은 AppTest.run()을 부른 스레드에서 만들어지므로 스레드별로 관리 -> 동시 세션에서도 사용 가능)
+# - 여러 스레드의 AppTest 실행을 한 번에 하나씩 처리
+#   (AppTest는 실행 중 Runtime 인스턴스/설정 같은 프로세스 전역 상태를 바꾸므로 동시에 돌리면 세션끼리 섞임)
+#   -> 실제 서버의 동시 실행(스레드 + GIL)과는 다르므로 부하 테스트는 rerun 실행 시간(last_service_ms)을 기준으로 봄
+
+APP = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'app.py')
+
+sent = []  # rerun 별 (새 요소 수, 바이트)
+_local = threading.local()
+_parse_tree = local_script_runner.parse_tree_from_messages
+
+
+def _record(messages):
+    # AppTest가 rerun 결과를 트리로 만들기 직전의 메시지 = 서버가 브라우저로 보내는 메시지
+    deltas = [m for m in messages if m.WhichOneof('type') == 'delta' and m.delta.WhichOneof('type') == 'new_element']
+    sent.append((len(deltas), sum(m.ByteSize() for m in messages)))
+    return _parse_tree(messages)
+
+
+def _rerun_data(**kwargs):
+    scope = getattr(_local, 'fragment_scope', None)
+    if scope:
+        kwargs.update(fragment_id_queue=list(scope), is_fragment_scoped_rerun=True)
+    return RerunData(**kwargs)
+
+
+class _FifoLock:
+    """먼저 요청한 세션부터 실행 (threading.Lock은 순서를 보장하지 않음)"""
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._next_ticket = 0
+        self._serving = 0
+
+    def __enter__(self):
+        with self._cond:
+            ticket = self._next_ticket
+            self._next_ticket += 1
+            self._cond.wait_for(lambda: self._serving == ticket)
+
+    def __exit__(self, *exc):
+        with self._cond:
+            self._serving += 1
+            self._cond.notify_all()
+
+
+_run_lock = _FifoLock()
+_app_test_run = AppTest._run
+
+
+def _serialized_run(self, *args, **kwargs):
+    with _run_lock:
+        start = time.perf_counter()
+        try:
+            return _app_test_run(self, *args, **kwargs)
+        finally:
+            _local.service_ms = (time.perf_counter() - start) * 1000
+
+
+def last_service_ms():
+    """이 스레드의 마지막 rerun 실행 시간 (다른 세션을 기다린 시간 제외)"""
+    return getattr(_local, 'service_ms', None)
+
+
+local_script_runner.parse_tree_from_messages = _record
+local_script_runner.RerunData = _rerun_data
+AppTest._run = _serialized_run
+
+
+def new_app(timeout=30):
+    return AppTest.from_file(APP, default_timeout=timeout)
+
+
+@contextmanager
+def fragment_scope(at):
+    """이 블록 안의 rerun은 현재 등록된 fragment만 다시 실행"""
+    _local.fragment_scope = list(at._fragment_storage._fragments)
+    try:
+        yield
+    finally:
+        _local.fragment_scope = None
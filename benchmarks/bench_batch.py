@@ -0,0 +1,50 @@
+"""일괄 채점 처리량: 워커 수별 학생/초
+  python -m benchmarks.bench_batch --students 200000 --workers 1 2 4 8
+"""
+import argparse
+import csv
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from compass.batch import DEFAULT_DATA_DIR, question_ids, score_stream, read_records
+from compass.loader import load_catalog
+from compass.values import VALUE_COLUMNS
+
+
+def write_responses(path, n, seed=0):
+    ids = question_ids(load_catalog(DEFAULT_DATA_DIR))
+    rng = np.random.default_rng(seed)
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['student_id'] + ids + VALUE_COLUMNS)
+        for start in range(0, n, 10_000):
+            size = min(10_000, n - start)
+            answers = rng.integers(1, 6, size=(size, len(ids)))
+            weights = rng.integers(0, 101, size=(size, len(VALUE_COLUMNS)))
+            for i in range(size):
+                writer.writerow([f"S{start + i:07d}"] + answers[i].tolist() + weights[i].tolist())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--students', type=int, default=100_000)
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4, os.cpu_count() or 1])
+    parser.add_argument('--chunk-size', type=int, default=2000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'responses.csv')
+        write_responses(path, args.students)
+        print(f"{'workers':>8} {'seconds':>8} {'students/s':>11}")
+        for workers in sorted(set(args.workers)):
+            start = time.perf_counter()
+            count = sum(len(rows) for rows in score_stream(read_records(path), workers, args.chunk_size))
+            elapsed = time.perf_counter() - start
+            print(f"{workers:>8} {elapsed:>8.2f} {count / elapsed:>11.0f}")
+
+
+if __name__ == '__main__':
+    main()
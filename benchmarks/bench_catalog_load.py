@@ -0,0 +1,57 @@
+"""카탈로그 로딩 시간: CSV/JSON 파싱 vs 디스크 컬럼 캐시(메모리 맵)
+  parse   : 원본 파일 파싱 + 추천용 행렬 생성 (캐시 없음)
+  compile : 파싱 + .cache 기록 (파일이 바뀐 뒤 첫 기동)
+  mmap    : .cache 메모리 맵 + 가이드 SQLite 열기 (재시작)
+  python -m benchmarks.bench_catalog_load --jobs 10000 100000
+"""
+import argparse
+import shutil
+import tempfile
+import time
+
+from benchmarks.synthetic import write_data_dir
+from compass.data import QUESTIONS
+from compass.loader import load_catalog
+from compass.recommend import JobScorer
+
+
+def timed(fn, runs):
+    best = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        elapsed = (time.perf_counter() - start) * 1000
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--jobs', type=int, nargs='+', default=[10_000, 100_000])
+    parser.add_argument('--runs', type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'jobs':>8} {'parse(ms)':>10} {'compile(ms)':>12} {'mmap(ms)':>9} {'speedup':>8}")
+    for n in args.jobs:
+        data_dir = tempfile.mkdtemp()
+        try:
+            write_data_dir(data_dir, n, QUESTIONS)
+
+            def parse():
+                catalog = load_catalog(data_dir, use_cache=False)
+                JobScorer.from_columns(catalog.jobs)
+
+            def compile_and_open():
+                shutil.rmtree(f"{data_dir}/.cache", ignore_errors=True)
+                load_catalog(data_dir)
+
+            parse_ms = timed(parse, args.runs)
+            compile_ms = timed(compile_and_open, args.runs)
+            mmap_ms = timed(lambda: load_catalog(data_dir), args.runs)
+            print(f"{n:>8} {parse_ms:>10.1f} {compile_ms:>12.1f} {mmap_ms:>9.1f} {parse_ms / mmap_ms:>7.1f}x")
+        finally:
+            shutil.rmtree(data_dir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
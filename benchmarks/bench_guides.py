@@ -0,0 +1,76 @@
+"""STEP 3 진로 가이드 조회 지연시간 / 메모리: dict 전체 로딩 vs SQLite + 렌더링 LRU
+  load : 가이드를 열 때 드는 시간과 메모리 (dict는 JSON 전체, SQLite는 연결만)
+  cold : LRU에 없는 직업 조회 (인덱스 조회 + HTML 생성)
+  hot  : 최근에 본 직업 조회 (LRU 적중)
+  miss : 가이드가 없는 직업 ("준비 중", 인덱스 조회만)
+  python -m benchmarks.bench_guides --guides 1000 100000
+"""
+import argparse
+import json
+import os
+import random
+import shutil
+import tempfile
+import time
+import tracemalloc
+
+from benchmarks.synthetic import synthetic_guide
+from compass.guide import GuideStore, write_sqlite
+
+
+def per_call_us(fn, names):
+    start = time.perf_counter()
+    for name in names:
+        fn(name)
+    return (time.perf_counter() - start) / len(names) * 1e6
+
+
+def measure(open_store, names, lookups):
+    tracemalloc.start()
+    start = time.perf_counter()
+    store = open_store()
+    load_ms = (time.perf_counter() - start) * 1000
+    memory_mb = tracemalloc.get_traced_memory()[0] / 2**20
+    tracemalloc.stop()
+
+    cold = per_call_us(store.rendered, random.sample(names, min(lookups, len(names))))
+    hot_names = names[:50]
+    per_call_us(store.rendered, hot_names)
+    hot = per_call_us(store.rendered, hot_names * (lookups // len(hot_names)))
+    miss = per_call_us(store.rendered, [f"없는 직업 {i}" for i in range(lookups)])
+    return load_ms, memory_mb, cold, hot, miss
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--guides', type=int, nargs='+', default=[1_000, 100_000])
+    parser.add_argument('--lookups', type=int, default=2_000)
+    args = parser.parse_args()
+
+    print(f"{'guides':>8} {'store':<7} {'load(ms)':>9} {'mem(MB)':>8} {'cold(us)':>9} {'hot(us)':>8} {'miss(us)':>9}")
+    for n in args.guides:
+        names = [f"직업 {i:06d}" for i in range(n)]
+        guide = synthetic_guide(names)
+        tmp = tempfile.mkdtemp()
+        try:
+            json_path = os.path.join(tmp, 'career_guide.json')
+            sqlite_path = os.path.join(tmp, 'guide.sqlite')
+            with open(json_path, 'w', encoding='utf-8') as f:
+                json.dump(guide, f, ensure_ascii=False)
+            write_sqlite(sqlite_path, guide)
+            del guide
+
+            def open_dict():
+                with open(json_path, encoding='utf-8') as f:
+                    return GuideStore.from_mapping(json.load(f))
+
+            for label, open_store in (('dict', open_dict), ('sqlite', lambda: GuideStore.from_sqlite(sqlite_path))):
+                random.seed(0)
+                load_ms, memory_mb, cold, hot, miss = measure(open_store, names, args.lookups)
+                print(f"{n:>8} {label:<7} {load_ms:>9.1f} {memory_mb:>8.1f} {cold:>9.1f} {hot:>8.2f} {miss:>9.1f}")
+        finally:
+            shutil.rmtree(tmp, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+"""import 시간 리포트 (python -X importtime 기반)
+  python -m benchmarks.bench_import
+  python -m benchmarks.bench_import --budget-ms 50   # 핵심 모듈이 예산을 넘으면 exit 1
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 콜드 스타트에 걸리는 핵심 모듈 = app.py가 최상단에서 import 하는 모듈 (예산 검사 대상)
+CORE_MODULES = [
+    'compass', 'compass.data', 'compass.holland', 'compass.values', 'compass.render', 'compass.guide',
+    'compass.cache', 'compass.catalog', 'compass.loader', 'compass.results', 'compass.profiling',
+]
+# 첫 rerun에서 data/ 캐시를 메모리 맵으로 열 때 불러오는 모듈 (참고용)
+CATALOG_MODULES = ['numpy']
+# 앱이 필요한 페이지에서만 불러오는 무거운 모듈 + streamlit 자체 (참고용)
+LAZY_MODULES = ['compass.recommend', 'compass.spatial', 'plotly.graph_objects', 'pandas', 'streamlit']
+
+
+def import_time(module, runs=3):
+    """새 인터프리터에서 module을 import 할 때의 누적 시간(ms, runs회 중 최소)과 느린 하위 모듈 목록"""
+    best = None
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+            cwd=ROOT, capture_output=True, text=True,
+        )
+        if result.returncode != 0:
+            return None, []
+        rows = []
+        for line in result.stderr.splitlines():
+            # "import time:   self [us] | cumulative | imported package"
+            if not line.startswith('import time:') or 'self [us]' in line:
+                continue
+            _, self_us, cumulative_us, name = [p.strip() for p in line.replace('import time:', '|', 1).split('|')]
+            rows.append((int(cumulative_us), int(self_us), name.strip()))
+        total_ms = rows[-1][0] / 1000
+        if best is None or total_ms < best[0]:
+            best = (total_ms, sorted(rows, key=lambda r: r[1], reverse=True))
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--budget-ms', type=float, default=None, help="핵심 모듈 import 시간 상한")
+    parser.add_argument('--top', type=int, default=5, help="모듈별로 보여줄 느린 하위 import 수")
+    args = parser.parse_args()
+
+    # 인터프리터 자체 기동 시간 (비교 기준)
+    baseline, startup_rows = import_time('sys')
+    startup = {name for _, _, name in startup_rows}
+    print(f"baseline interpreter: {baseline:.1f} ms\n")
+    print(f"{'module':<24} {'import(ms)':>10}  slowest self-time imports")
+
+    over_budget = []
+    for module in CORE_MODULES + CATALOG_MODULES + LAZY_MODULES:
+        total_ms, rows = import_time(module)
+        if total_ms is None:
+            print(f"{module:<24} {'missing':>10}")
+            continue
+        rows = [r for r in rows if r[2] not in startup]
+        slowest = ', '.join(f"{name} {self_us / 1000:.1f}" for _, self_us, name in rows[:args.top])
+        marker = ' ' if module in CORE_MODULES else '+' if module in CATALOG_MODULES else '*'
+        print(f"{module:<24}{marker}{total_ms:>10.1f}  {slowest}")
+        if args.budget_ms is not None and module in CORE_MODULES and total_ms > args.budget_ms:
+            over_budget.append(module)
+
+    print("\n+ imported on the first rerun when the catalog is opened from the data/ cache (memory map)")
+    print("* not imported at app start-up (loaded by the STEP that needs it) or streamlit itself")
+    if over_budget:
+        print(f"over budget ({args.budget_ms} ms): {', '.join(over_budget)}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,43 @@
+"""STEP 3 추천 쿼리 지연시간: 전수 계산(JobScorer) vs KD-트리 인덱스(ValueIndex)
+  python -m benchmarks.bench_index --sizes 30 10000 500000
+"""
+import argparse
+import time
+
+import numpy as np
+
+from benchmarks.synthetic import synthetic_jobs, synthetic_users
+from compass.recommend import JobScorer
+from compass.spatial import ValueIndex
+
+
+def _per_query_ms(fn, users, k):
+    start = time.perf_counter()
+    results = [fn(vec, code, k) for code, vec in users]
+    return (time.perf_counter() - start) * 1000 / len(users), results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[30, 10_000, 500_000])
+    parser.add_argument('--queries', type=int, default=200)
+    parser.add_argument('-k', type=int, default=5)
+    args = parser.parse_args()
+
+    users = synthetic_users(args.queries)
+    print(f"{'jobs':>8} {'leaf':>5} {'build(ms)':>10} {'brute(ms/q)':>12} {'index(ms/q)':>12} {'speedup':>8}  identical")
+    for n in args.sizes:
+        scorer = JobScorer(*synthetic_jobs(n))
+        start = time.perf_counter()
+        # brute_force_below=0: 작은 카탈로그에서도 인덱스 경로를 그대로 측정
+        index = ValueIndex(scorer, brute_force_below=0)
+        build_ms = (time.perf_counter() - start) * 1000
+
+        brute_ms, expected = _per_query_ms(scorer.top_k, users, args.k)
+        index_ms, got = _per_query_ms(index.top_k, users, args.k)
+        identical = all(np.array_equal(a, b) for a, b in zip(expected, got))
+        print(f"{n:>8} {index.leaf_size:>5} {build_ms:>10.1f} {brute_ms:>12.3f} {index_ms:>12.3f} {brute_ms / index_ms:>7.1f}x  {identical}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,277 @@
+"""학교 단위 동시 접속 부하 테스트 (AppTest로 app.py를 브라우저 없이 실행)
+세션 N개가 동시에 STEP 1 -> 3 전체 흐름을 진행합니다.
+  open           : 첫 화면
+  step1.page     : (COMPASS_FORM_MODE=paged) 다음 파트
+  step1.submit   : 36문항(q_Q*) 무작위 응답 후 holland_form 제출
+  step2.slider   : 가치관 슬라이더 조작 (실제 서버처럼 fragment 범위 rerun)
+  step3.results  : "결과 분석 보기" -> 추천 TOP 5 + 첫 직업 로드맵
+  step3.roadmap  : 다른 추천 직업 로드맵 열기
+카탈로그 크기별로 rerun 실행 시간 분위수, 세션당 메모리(RSS), 추천 계산 처리량을 측정하고
+JSON으로 저장해 실행 간 비교에 사용합니다. (AppTest 자체 오버헤드 포함, 세션은 같은 프로세스의 스레드)
+  service_ms : rerun 자체 실행 시간 (주 지표)
+  queued_ms  : 요청부터 화면까지 (다른 세션의 rerun을 기다린 시간 포함, 참고용)
+한계: AppTest는 프로세스 전역 상태를 바꾸므로 rerun을 한 번에 하나씩(요청 순서대로) 실행합니다.
+세션 상태/메모리는 동시에 유지되지만 rerun이 실제 서버처럼 병렬로 겹치지는 않으므로,
+queued_ms는 서버의 동시 접속 지연시간이 아니라 이 직렬 실행 대기열의 길이를 보여 줍니다.
+  python -m benchmarks.bench_load --sessions 30 --jobs 30 1000 10000 100000
+  python -m benchmarks.bench_load --compare benchmarks/results/load-이전실행.json 2>/dev/null  (AppTest 경고는 stderr)
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import resource
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import streamlit as st
+
+from benchmarks.apptest import fragment_scope, last_service_ms, new_app
+from benchmarks.synthetic import synthetic_users, write_data_dir
+from compass.data import QUESTIONS
+from compass.loader import load_catalog
+from compass.results import close_all
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'results')
+METHOD = (
+    "AppTest sessions on threads in one process; reruns are serialized in request (FIFO) order because "
+    "AppTest mutates process-global state. service_ms is the time of the rerun itself (headline). "
+    "queued_ms adds the wait for other sessions' reruns and does not model a Streamlit server's concurrent reruns."
+)
+PHASES = ('open', 'step1.page', 'step1.submit', 'step2.slider', 'step3.results', 'step3.roadmap')
+
+
+def rss_bytes():
+    """현재 프로세스 RSS (리눅스 /proc, 그 외에는 최대 RSS로 대체)"""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except OSError:
+        usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return usage if sys.platform == 'darwin' else usage * 1024
+
+
+class PeakRss:
+    """블록 실행 중 RSS 최댓값 (interval 초마다 확인)"""
+
+    def __init__(self, interval=0.02):
+        self.interval = interval
+        self.peak = 0
+        self._stop = threading.Event()
+
+    def _sample(self):
+        while not self._stop.is_set():
+            self.peak = max(self.peak, rss_bytes())
+            self._stop.wait(self.interval)
+
+    def __enter__(self):
+        self.peak = rss_bytes()
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+        self.peak = max(self.peak, rss_bytes())
+
+
+def percentiles(values):
+    values = sorted(values)
+    if len(values) < 2:
+        return {'count': len(values), 'p50': values[0] if values else None, 'p95': None, 'p99': None, 'max': values[-1] if values else None}
+    cuts = statistics.quantiles(values, n=100, method='inclusive')
+    return {'count': len(values), 'p50': statistics.median(values), 'p95': cuts[94], 'p99': cuts[98], 'max': values[-1]}
+
+
+def run_session(index, args):
+    """세션 하나의 STEP 1 -> 3 흐름. (AppTest, [(단계, queued ms, service ms)]) 반환 (메모리 측정이 끝날 때까지 AppTest 유지)"""
+    rng = random.Random(args.seed + index)
+    at = new_app(timeout=args.timeout)
+    timings = []
+
+    def timed(phase, run):
+        start = time.perf_counter()
+        run()
+        timings.append((phase, (time.perf_counter() - start) * 1000, last_service_ms()))
+        if at.exception:
+            raise RuntimeError(f"{phase}: {at.exception[0].message}")
+
+    timed('open', at.run)
+
+    # STEP 1: 화면에 있는 q_Q* 라디오에 무작위 응답 후 제출 (paged 모드면 파트마다 다음으로)
+    while at.session_state.step == 1:
+        for radio in at.radio:
+            radio.set_value(rng.randint(1, 5))
+        button = next(b for b in at.button if b.label.startswith(('다음 파트', '검사 완료')))
+        timed('step1.page' if button.label.startswith('다음 파트') else 'step1.submit', button.click().run)
+
+    # STEP 2: 슬라이더만 다시 실행되는 fragment rerun
+    # (fragment rerun 뒤의 요소 트리에는 fragment 밖의 버튼이 없으므로 미리 찾아 둠)
+    result_button = next(b for b in at.button if b.label.startswith('결과 분석'))
+    with fragment_scope(at):
+        for _ in range(args.slider_moves):
+            slider = at.slider[rng.randrange(len(at.slider))]
+            timed('step2.slider', slider.set_value(rng.randint(0, 100)).run)
+    timed('step3.results', result_button.click().run)
+
+    # STEP 3: 추천 직업 로드맵 여러 개 열어 보기
+    options = at.selectbox[0].options
+    for i in range(min(args.roadmaps, len(options) - 1)):
+        timed('step3.roadmap', at.selectbox[0].set_value(options[i + 1]).run)
+    return at, timings
+
+
+def scoring_throughput(data_dir, queries, seed):
+    """추천 인덱스 top-k 처리량 (세션 공유 캐시를 거치지 않은 계산만)"""
+    recommender = load_catalog(data_dir).recommender()
+    users = synthetic_users(queries, seed=seed)
+    code, vector = users[0]
+    recommender.top_k(vector, code, 5)  # 첫 질의(인덱스 생성) 제외
+    start = time.perf_counter()
+    for code, vector in users:
+        recommender.top_k(vector, code, 5)
+    elapsed = time.perf_counter() - start
+    return {'queries': queries, 'queries_per_s': queries / elapsed, 'ms_per_query': elapsed / queries * 1000}
+
+
+def run_size(n_jobs, args):
+    data_dir = tempfile.mkdtemp(prefix=f'compass-load-{n_jobs}-')
+    try:
+        write_data_dir(data_dir, n_jobs, QUESTIONS, seed=args.seed)
+        os.environ['COMPASS_DATA_DIR'] = data_dir
+        os.environ['COMPASS_RESULTS_DB'] = os.path.join(data_dir, 'results.sqlite')  # 측정이 끝나면 폴더째 삭제
+        st.cache_resource.clear()
+
+        # 카탈로그 로딩(.cache 생성 포함)과 plotly import는 첫 세션 한 번만 -> 측정에서 제외
+        before = rss_bytes()
+        start = time.perf_counter()
+        run_session(-1, args)
+        warm_up_ms = (time.perf_counter() - start) * 1000
+        baseline = rss_bytes()
+
+        errors = []
+        sessions = []
+        start = time.perf_counter()
+        with PeakRss() as peak, ThreadPoolExecutor(max_workers=args.sessions) as pool:
+            futures = [pool.submit(run_session, i, args) for i in range(args.sessions)]
+            for future in futures:
+                try:
+                    sessions.append(future.result())
+                except Exception as exc:
+                    errors.append(repr(exc))
+        wall = time.perf_counter() - start
+
+        timings = [t for _, session_timings in sessions for t in session_timings]
+        by_phase = {phase: [t for t in timings if t[0] == phase] for phase in PHASES}
+        result = {
+            'jobs': n_jobs,
+            'sessions': args.sessions,
+            'completed': len(sessions),
+            'errors': errors,
+            'wall_s': wall,
+            'reruns_per_s': len(timings) / wall,
+            'warm_up_session_ms': warm_up_ms,
+            'service_ms': {
+                'all': percentiles([t[2] for t in timings]),
+                **{phase: percentiles([t[2] for t in values]) for phase, values in by_phase.items() if values},
+            },
+            'queued_ms': {
+                'all': percentiles([t[1] for t in timings]),
+                **{phase: percentiles([t[1] for t in values]) for phase, values in by_phase.items() if values},
+            },
+            'rss_mb': {
+                'catalog_and_imports': (baseline - before) / 2**20,
+                'baseline': baseline / 2**20,
+                'peak': peak.peak / 2**20,
+                'per_session': (peak.peak - baseline) / 2**20 / max(args.sessions, 1),
+            },
+            'scoring': scoring_throughput(data_dir, args.queries, args.seed),
+        }
+        del sessions
+        return result
+    finally:
+        # cache_resource.clear()는 객체를 닫지 않으므로 결과 저장소(기록 스레드 + DB 연결)는 직접 닫은 뒤 임시 폴더 삭제
+        close_all()
+        st.cache_resource.clear()
+        shutil.rmtree(data_dir, ignore_errors=True)
+
+
+def git_revision():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              cwd=os.path.dirname(RESULTS_DIR), check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_report(report, previous=None):
+    previous_runs = {run['jobs']: run for run in previous['runs']} if previous else {}
+    print(f"{'jobs':>7} {'phase':<14} {'count':>6} {'p50(ms)':>8} {'p95(ms)':>8} {'p99(ms)':>8} {'queued p95':>11} {'prev p95':>9}")
+    for run in report['runs']:
+        prev = previous_runs.get(run['jobs'], {}).get('service_ms', {})
+        for phase, stats in run['service_ms'].items():
+            prev_p95 = prev.get(phase, {}).get('p95')
+            print(f"{run['jobs']:>7} {phase:<14} {stats['count']:>6} {stats['p50']:>8.1f} {stats['p95'] or 0:>8.1f} "
+                  f"{stats['p99'] or 0:>8.1f} {run['queued_ms'][phase]['p95'] or 0:>11.1f} "
+                  f"{'' if prev_p95 is None else f'{prev_p95:.1f}':>9}")
+        rss, scoring = run['rss_mb'], run['scoring']
+        print(f"{run['jobs']:>7} sessions={run['completed']}/{run['sessions']} errors={len(run['errors'])} "
+              f"reruns/s={run['reruns_per_s']:.1f} rss/session={rss['per_session']:.1f}MB peak={rss['peak']:.0f}MB "
+              f"scoring={scoring['queries_per_s']:.0f} q/s")
+        for error in run['errors'][:3]:
+            print(f"        ! {error}")
+    print("service = rerun execution time; queued = including waiting for other sessions (serialized AppTest, see 'method')")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sessions', type=int, default=20, help='동시 세션 수')
+    parser.add_argument('--jobs', type=int, nargs='+', default=[30, 1_000, 10_000, 100_000], help='합성 카탈로그 직업 수')
+    parser.add_argument('--slider-moves', type=int, default=5)
+    parser.add_argument('--roadmaps', type=int, default=3, help='세션당 열어 보는 추천 직업 로드맵 수 (최대 4)')
+    parser.add_argument('--queries', type=int, default=2_000, help='추천 처리량 측정 질의 수')
+    parser.add_argument('--timeout', type=float, default=120, help='rerun 한 번의 제한 시간(초)')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', help='결과 JSON 경로 (기본: benchmarks/results/load-<시각>.json)')
+    parser.add_argument('--compare', help='이전 결과 JSON (p95 비교 출력)')
+    args = parser.parse_args()
+
+    previous = None
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            previous = json.load(f)
+
+    report = {
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'revision': git_revision(),
+        'python': platform.python_version(),
+        'streamlit': st.__version__,
+        'platform': platform.platform(),
+        'cpus': os.cpu_count(),
+        'form_mode': os.environ.get('COMPASS_FORM_MODE', 'compact'),
+        'method': METHOD,
+        'args': {k: v for k, v in vars(args).items() if k not in ('output', 'compare')},
+        'runs': [],
+    }
+    for n in args.jobs:
+        report['runs'].append(run_size(n, args))
+
+    output = args.output or os.path.join(RESULTS_DIR, f"load-{time.strftime('%Y%m%d-%H%M%S')}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+    print_report(report, previous)
+    print(f"saved {output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+"""결과 저장소: 동시 제출 시 rerun이 기다리는 시간(submit) / 기록 처리량 / 대시보드 조회 시간
+  submit    : 세션 스레드에서 submit() 한 번에 걸리는 시간 (큐에 넣기만 함)
+  write     : 모든 결과가 디스크에 기록될 때까지의 처리량
+  dashboard : 저장된 결과 수와 무관하게 집계 테이블만 읽는지 확인
+  python -m benchmarks.bench_results --results 1000 100000 --sessions 30
+"""
+import argparse
+import os
+import shutil
+import statistics
+import tempfile
+import threading
+import time
+
+from benchmarks.synthetic import synthetic_users
+from compass.holland import HOLLAND_TYPES
+from compass.results import ResultStore
+
+
+def result(i, user, cohorts):
+    code, vector = user
+    return {
+        'id': f"bench-{i}",
+        'cohort': f"{i % cohorts + 1}반",
+        'holland_code': code,
+        'holland_scores': {t: 6 + (i * (k + 3)) % 25 for k, t in enumerate(HOLLAND_TYPES)},
+        'user_vector': list(vector),
+        'top_jobs': [f"직업 {(i + k) % 200}" for k in range(5)],
+        'selected_job': f"직업 {i % 200}",
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--results', type=int, nargs='+', default=[1_000, 100_000])
+    parser.add_argument('--sessions', type=int, default=30, help='동시에 제출하는 세션(스레드) 수')
+    parser.add_argument('--cohorts', type=int, default=10)
+    args = parser.parse_args()
+
+    print(f"{'results':>8} {'submit p50(us)':>15} {'submit p99(us)':>15} {'write(rows/s)':>14} {'dashboard(ms)':>14}")
+    for n in args.results:
+        tmp = tempfile.mkdtemp()
+        try:
+            store = ResultStore(os.path.join(tmp, 'results.sqlite'))
+            users = synthetic_users(n, seed=n)
+            records = [result(i, user, args.cohorts) for i, user in enumerate(users)]
+            times = [[] for _ in range(args.sessions)]
+
+            def session(worker):
+                for record in records[worker::args.sessions]:
+                    start = time.perf_counter()
+                    store.submit(record)
+                    times[worker].append((time.perf_counter() - start) * 1e6)
+
+            start = time.perf_counter()
+            threads = [threading.Thread(target=session, args=(w,)) for w in range(args.sessions)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            store.flush()
+            rate = n / (time.perf_counter() - start)
+
+            start = time.perf_counter()
+            for _ in range(100):
+                store.summary("1반")
+            dashboard = (time.perf_counter() - start) * 10
+            store.close()
+
+            flat = [x for worker in times for x in worker]
+            p50 = statistics.median(flat)
+            p99 = statistics.quantiles(flat, n=100)[-1]
+            print(f"{n:>8} {p50:>15.1f} {p99:>15.1f} {rate:>14.0f} {dashboard:>14.2f}")
+        finally:
+            shutil.rmtree(tmp, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+"""세션 N개가 동시에 STEP 3 rerun 할 때의 메모리/지연 비교
+  cache_data : rerun마다 (questions, df_jobs, guide) 복사본을 받고 df_jobs['Score']에 기록 (기존 방식)
+  catalog    : 프로세스 공유 읽기 전용 Catalog + 세션별 작은 결과 배열
+  python -m benchmarks.bench_sessions --jobs 30 5000 --sessions 1 100 500
+"""
+import argparse
+import pickle
+import time
+import tracemalloc
+
+import pandas as pd
+
+from benchmarks.synthetic import synthetic_job_columns, synthetic_users
+from compass.catalog import Catalog
+from compass.data import CAREER_GUIDE, QUESTIONS
+
+
+def cache_data_rerun(blob, scorer, user):
+    # st.cache_data 는 반환값을 pickle 로 보관했다가 호출마다 unpickle 해서 돌려줌
+    questions, df_jobs, guide = pickle.loads(blob)
+    code, vec = user
+    df_jobs['Score'] = scorer.scores(vec, code)
+    top = df_jobs.sort_values('Score', ascending=False).head(5)['직업군'].tolist()
+    return questions, df_jobs, guide, top
+
+
+def catalog_rerun(catalog, user):
+    code, vec = user
+    top, scores = catalog.recommender().recommend(vec, code, 5)
+    return top, scores
+
+
+def measure(rerun, users):
+    """세션 수만큼 rerun 결과를 동시에 들고 있을 때의 (세션당 KB, rerun당 ms) - 양쪽 모두 tracemalloc 켠 상태"""
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    start = time.perf_counter()
+    alive = [rerun(user) for user in users]
+    elapsed = time.perf_counter() - start
+    current = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del alive
+    return (current - base) / 1024 / len(users), elapsed * 1000 / len(users)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--jobs', type=int, nargs='+', default=[30, 5000])
+    parser.add_argument('--sessions', type=int, nargs='+', default=[1, 100, 500])
+    args = parser.parse_args()
+
+    print(f"{'jobs':>6} {'sessions':>8}  {'cache_data KB/sess':>18} {'ms/rerun':>9}  {'catalog KB/sess':>15} {'ms/rerun':>9}")
+    for n_jobs in args.jobs:
+        columns = synthetic_job_columns(n_jobs)
+        catalog = Catalog(QUESTIONS, columns, CAREER_GUIDE)
+        scorer = catalog.recommender().scorer
+        blob = pickle.dumps((QUESTIONS, pd.DataFrame(columns), CAREER_GUIDE))
+        for n_sessions in args.sessions:
+            users = synthetic_users(n_sessions)
+            old_kb, old_ms = measure(lambda u: cache_data_rerun(blob, scorer, u), users)
+            new_kb, new_ms = measure(lambda u: catalog_rerun(catalog, u), users)
+            print(f"{n_jobs:>6} {n_sessions:>8}  {old_kb:>18.1f} {old_ms:>9.3f}  {new_kb:>15.2f} {new_ms:>9.3f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,30 @@
+"""STEP 1 rerun 당 요소 수 / 전송 바이트 (웹소켓으로 나가는 ForwardMsg 직렬화 크기 합계)
+  python -m benchmarks.bench_step1_payload
+"""
+import argparse
+import os
+
+from benchmarks.apptest import new_app, sent
+
+
+def measure(mode):
+    os.environ['COMPASS_FORM_MODE'] = mode
+    at = new_app().run()
+    # 두 번째 run: 사이드바 등으로 다시 그려질 때 (폼 제출 없는 rerun)
+    at.run()
+    return sent[-2], sent[-1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--modes', nargs='+', default=['classic', 'compact', 'paged'])
+    args = parser.parse_args()
+
+    print(f"{'mode':<8} {'elements':>9} {'bytes':>8}  {'rerun elements':>14} {'rerun bytes':>11}")
+    for mode in args.modes:
+        (elements, size), (rerun_elements, rerun_size) = measure(mode)
+        print(f"{mode:<8} {elements:>9} {size:>8}  {rerun_elements:>14} {rerun_size:>11}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+"""STEP 2 슬라이더 조작 시 rerun 지연시간 / 전송 바이트
+  full     : 스크립트 전체 rerun (fragment 적용 전과 동일한 범위)
+  fragment : 슬라이더 + 레이더 차트 fragment만 rerun
+레이더 차트 모드(rebuild/patch)별로 측정합니다. AppTest 자체 오버헤드가 포함된 값입니다.
+  python -m benchmarks.bench_step2_sliders --moves 50
+"""
+import argparse
+import os
+import statistics
+import time
+
+from benchmarks.apptest import fragment_scope, new_app, sent
+
+
+def to_step2(at):
+    at.run()
+    at.button[0].click().run()  # STEP 1 기본 응답으로 제출
+    assert at.session_state.step == 2
+
+
+def slider_moves(at, moves):
+    times, sizes = [], []
+    for i in range(moves):
+        start = time.perf_counter()
+        at.slider[i % 5].set_value((i * 7) % 101).run()
+        times.append((time.perf_counter() - start) * 1000)
+        sizes.append(sent[-1][1])
+    return times, sizes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--moves', type=int, default=50)
+    args = parser.parse_args()
+
+    print(f"{'radar':<8} {'scope':<9} {'p50(ms)':>8} {'p95(ms)':>8} {'bytes/rerun':>12}")
+    for radar in ('rebuild', 'patch'):
+        os.environ['COMPASS_RADAR_MODE'] = radar
+        for scope in ('full', 'fragment'):
+            at = new_app()
+            to_step2(at)
+            if scope == 'fragment':
+                with fragment_scope(at):
+                    times, sizes = slider_moves(at, args.moves)
+            else:
+                times, sizes = slider_moves(at, args.moves)
+            p50 = statistics.median(times)
+            p95 = statistics.quantiles(times, n=20)[-1]
+            print(f"{radar:<8} {scope:<9} {p50:>8.1f} {p95:>8.1f} {statistics.mean(sizes):>12.0f}")
+
+
+if __name__ == '__main__':
+    main()
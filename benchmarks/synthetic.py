@@ -0,0 +1,68 @@
+import numpy as np
+
+from compass.holland import HOLLAND_CODES
+
+# 벤치마크용 가상 직업 카탈로그
+
+def synthetic_jobs(n, seed=0):
+    """(직업명, 홀란드 코드, 가치관 행렬) - 실제 직업 데이터와 비슷한 분포(5~60점 정수)"""
+    rng = np.random.default_rng(seed)
+    names = [f"가상 직업 {i}" for i in range(n)]
+    codes = [HOLLAND_CODES[i] for i in rng.integers(0, len(HOLLAND_CODES), n)]
+    values = rng.integers(5, 61, size=(n, 5)).astype(np.float32)
+    return names, codes, values
+
+
+def synthetic_users(n, seed=1):
+    """(홀란드 코드, 정규화된 가치관 벡터) 목록 - STEP 2 슬라이더(0~100)와 같은 방식으로 정규화"""
+    rng = np.random.default_rng(seed)
+    users = []
+    for _ in range(n):
+        raw = rng.integers(0, 101, 5)
+        total = int(raw.sum()) or 1
+        code = HOLLAND_CODES[rng.integers(0, len(HOLLAND_CODES))]
+        users.append((code, [(int(x) / total) * 100 for x in raw]))
+    return users
+
+
+def synthetic_job_columns(n, seed=0):
+    """compass.data.JOBS 와 같은 컬럼 형식의 가상 직업 데이터"""
+    names, codes, values = synthetic_jobs(n, seed)
+    columns = {'직업군': names, 'Holland_Code': codes}
+    for i, column in enumerate(['Money', 'WLB', 'Culture', 'Location', 'Stability']):
+        columns[column] = values[:, i].astype(int).tolist()
+    return columns
+
+
+def synthetic_guide(names, steps=5):
+    """직업별 진로 가이드 (CAREER_GUIDE 형식)"""
+    return {
+        name: {
+            "major": f"{name} 관련 학과, 융합전공",
+            "hs_g": "수학I/II, 미적분, 물리학I, 정보",
+            "hs_c": "인공지능 수학, 정보과학",
+            "steps": [f"{name} 준비 {i + 1}단계: 관련 활동 및 경험 쌓기" for i in range(steps)],
+        }
+        for name in names
+    }
+
+
+def write_data_dir(path, n_jobs, questions, seed=0):
+    """compass.loader 형식의 data 폴더 (questions.csv, jobs.csv, career_guide.json) 생성"""
+    import csv
+    import json
+    import os
+
+    os.makedirs(path, exist_ok=True)
+    columns = synthetic_job_columns(n_jobs, seed)
+    with open(os.path.join(path, 'questions.csv'), 'w', encoding='utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=['id', 'text', 'type'])
+        writer.writeheader()
+        writer.writerows(questions)
+    with open(os.path.join(path, 'jobs.csv'), 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(list(columns))
+        writer.writerows(zip(*columns.values()))
+    with open(os.path.join(path, 'career_guide.json'), 'w', encoding='utf-8') as f:
+        json.dump(synthetic_guide(columns['직업군']), f, ensure_ascii=False)
+    return columns
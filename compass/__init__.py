@@ -0,0 +1 @@
+# Career Compass 핵심 로직 (Streamlit 비의존)
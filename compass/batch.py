@@ -0,0 +1,211 @@
+import argparse
+import csv
+import itertools
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from compass.holland import holland_code, tally
+from compass.loader import load_catalog
+from compass.values import DEFAULT_WEIGHTS, VALUE_COLUMNS, normalize_weights
+
+# -----------------------------------------------------------------------------
+# 학교 단위 일괄 채점 (종이 설문 / 구글 설문지 응답 시트)
+# -----------------------------------------------------------------------------
+# 입력 파일(CSV 또는 JSONL)의 한 행 = 학생 한 명
+#   Q1..Q36      : 1~5점 응답 (빈 칸이면 3점, 문항은 앱과 같은 data/questions.csv 기준)
+#   Money..Stability : 가치관 슬라이더 값 0~100 (빈 칸이면 앱 기본값)
+#   그 외 컬럼(학번, 이름 등)은 결과 파일에 그대로 복사
+# 파일을 chunk 단위로 읽어 프로세스 풀에서 채점하고, 끝난 순서가 아닌 입력 순서대로
+# 바로 기록하므로 입력 크기와 관계없이 메모리 사용량이 일정합니다.
+#
+#   python -m compass.batch responses.csv -o results.csv
+#   python -m compass.batch responses.jsonl -o results.parquet --workers 8 --data-dir /srv/compass/data
+
+# 앱과 같은 카탈로그 (COMPASS_DATA_DIR, 기본은 저장소의 data/)
+DEFAULT_DATA_DIR = os.environ.get(
+    'COMPASS_DATA_DIR', os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data')
+)
+
+_catalog = None
+
+
+def _init_worker(data_dir):
+    # 프로세스마다 한 번만 카탈로그(디스크 캐시 메모리 맵) 열기
+    global _catalog
+    _catalog = load_catalog(data_dir)
+
+
+def question_ids(catalog):
+    return [q['id'] for q in catalog.questions]
+
+
+def _parse_int(value, default, column, line_no, low, high):
+    if value is None or str(value).strip() == '':
+        return default
+    try:
+        # "4", "4.0", 4 는 허용 / 3.7, inf, true, [1] 등은 거부
+        if isinstance(value, bool):
+            raise TypeError
+        number = float(value)
+        if not number.is_integer():
+            raise ValueError
+        number = int(number)
+    except (TypeError, ValueError, OverflowError):
+        raise ValueError(f"line {line_no}: {column}={value!r} is not an integer") from None
+    if not low <= number <= high:
+        raise ValueError(f"line {line_no}: {column}={number} is out of range {low}-{high}")
+    return number
+
+
+def score_record(record, line_no, catalog, top_k=5):
+    questions = catalog.questions
+    answers = {q['id']: _parse_int(record.get(q['id']), 3, q['id'], line_no, 1, 5) for q in questions}
+    scores = tally(answers, questions)
+    code = holland_code(scores)
+    weights = [_parse_int(record.get(c), d, c, line_no, 0, 100) for c, d in zip(VALUE_COLUMNS, DEFAULT_WEIGHTS)]
+    recommender = catalog.recommender()
+    jobs = [str(recommender.names[i]) for i in recommender.top_k(normalize_weights(weights), code, top_k)]
+    return code, scores, jobs
+
+
+def score_chunk(chunk, top_k=5):
+    """[(행 번호, 레코드)] -> 결과 행 목록 (워커 프로세스에서 실행)"""
+    catalog = _catalog or load_catalog(DEFAULT_DATA_DIR)
+    input_columns = set(question_ids(catalog)) | set(VALUE_COLUMNS)
+    rows = []
+    for line_no, record in chunk:
+        code, scores, jobs = score_record(record, line_no, catalog, top_k)
+        row = {k: v for k, v in record.items() if k not in input_columns}
+        row['holland_code'] = code
+        row.update(scores)
+        for rank in range(top_k):
+            row[f'job_{rank + 1}'] = jobs[rank] if rank < len(jobs) else ''
+        rows.append(row)
+    return rows
+
+
+def read_records(path):
+    """(행 번호, dict) 를 한 줄씩 생성 - 파일 전체를 메모리에 올리지 않음"""
+    if path.endswith(('.jsonl', '.ndjson')):
+        with open(path, encoding='utf-8') as f:
+            for line_no, line in enumerate(f, start=1):
+                if line.strip():
+                    yield line_no, json.loads(line)
+    else:
+        # 구글 설문지/엑셀 CSV는 BOM이 붙어 있는 경우가 많음
+        with open(path, encoding='utf-8-sig', newline='') as f:
+            for line_no, record in enumerate(csv.DictReader(f), start=2):
+                yield line_no, record
+
+
+def chunked(iterable, size):
+    it = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(it, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def score_stream(records, workers=None, chunk_size=2000, top_k=5, data_dir=DEFAULT_DATA_DIR):
+    """입력 순서대로 결과 chunk 생성. 동시에 처리 중인 chunk 수를 workers*2로 제한"""
+    # 먼저 이 프로세스에서 한 번 읽어 두면 디스크 캐시가 만들어져 워커들은 메모리 맵으로 바로 열 수 있음
+    _init_worker(data_dir)
+    chunks = chunked(records, chunk_size)
+    if workers == 1:
+        for chunk in chunks:
+            yield score_chunk(chunk, top_k)
+        return
+
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(data_dir,)) as pool:
+        pending = [pool.submit(score_chunk, c, top_k) for c in itertools.islice(chunks, workers * 2)]
+        while pending:
+            rows = pending.pop(0).result()
+            for chunk in itertools.islice(chunks, 1):
+                pending.append(pool.submit(score_chunk, chunk, top_k))
+            yield rows
+
+
+def check_columns(rows, columns):
+    """첫 chunk로 정한 결과 컬럼에 없는 컬럼이 나중에 나오면 오류 (조용히 버리지 않음)"""
+    for row in rows:
+        extra = [k for k in row if k not in columns]
+        if extra:
+            raise ValueError(f"column {extra[0]!r} first appears after the output header was written; "
+                             "list every column in the first record (JSONL) or use a CSV input")
+
+
+class CsvWriter:
+    def __init__(self, path):
+        # 엑셀에서 한글이 깨지지 않도록 BOM 포함
+        self.file = open(path, 'w', encoding='utf-8-sig', newline='')
+        self.writer = None
+
+    def write(self, rows):
+        if self.writer is None:
+            self.writer = csv.DictWriter(self.file, fieldnames=list(rows[0]))
+            self.writer.writeheader()
+        check_columns(rows, set(self.writer.fieldnames))
+        self.writer.writerows(rows)
+
+    def close(self):
+        self.file.close()
+
+
+class ParquetWriter:
+    def __init__(self, path):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise SystemExit("Parquet output requires pyarrow: pip install pyarrow") from None
+        self.pa, self.pq, self.path = pa, pq, path
+        self.writer = None
+
+    def write(self, rows):
+        if self.writer is not None:
+            check_columns(rows, set(self.writer.schema.names))
+        table = self.pa.Table.from_pylist(rows, schema=self.writer.schema if self.writer else None)
+        if self.writer is None:
+            self.writer = self.pq.ParquetWriter(self.path, table.schema)
+        self.writer.write_table(table)
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m compass.batch', description="홀란드 검사 응답 시트 일괄 채점")
+    parser.add_argument('input', help="응답 파일 (.csv 또는 .jsonl)")
+    parser.add_argument('-o', '--output', required=True, help="결과 파일 (.csv 또는 .parquet)")
+    parser.add_argument('--workers', type=int, default=None, help="프로세스 수 (기본: CPU 코어 수)")
+    parser.add_argument('--chunk-size', type=int, default=2000)
+    parser.add_argument('--top-k', type=int, default=5)
+    parser.add_argument('--data-dir', default=DEFAULT_DATA_DIR, help="카탈로그 폴더 (기본: COMPASS_DATA_DIR 또는 data/)")
+    args = parser.parse_args(argv)
+
+    try:
+        # 카탈로그 파일 오류는 응답 파일 오류와 구분해서 알림
+        load_catalog(args.data_dir)
+    except ValueError as e:
+        raise SystemExit(f"catalog: {e}") from None
+
+    writer = ParquetWriter(args.output) if args.output.endswith('.parquet') else CsvWriter(args.output)
+    count = 0
+    try:
+        for rows in score_stream(read_records(args.input), args.workers, args.chunk_size, args.top_k, args.data_dir):
+            writer.write(rows)
+            count += len(rows)
+    except ValueError as e:
+        raise SystemExit(f"{args.input}: {e}") from None
+    finally:
+        writer.close()
+    print(f"{count} students scored -> {args.output}", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+import itertools
+import math
+import threading
+from collections import OrderedDict
+
+from compass.values import DEFAULT_WEIGHTS, normalize_weights
+
+# -----------------------------------------------------------------------------
+# 추천 결과 캐시 (STEP 3)
+# -----------------------------------------------------------------------------
+# 입력 공간이 작음: 홀란드 코드 30가지 x 슬라이더 정수 5개(대부분 기본값 근처).
+# (홀란드 코드, 슬라이더를 최대공약수로 나눈 튜플, k)를 키로 top-k 결과를 LRU로 보관하고
+# 모든 세션이 공유합니다. 비율이 같은 슬라이더 값(50/50/20/30/50 과 100/100/40/60/100)은
+# 정규화된 가치관 벡터가 정확히 같으므로 같은 키가 됩니다.
+
+
+def cache_key(holland_code, weights, k=5):
+    weights = tuple(int(w) for w in weights)
+    divisor = math.gcd(*weights) or 1
+    return holland_code, tuple(w // divisor for w in weights), k
+
+
+def common_weights(base=DEFAULT_WEIGHTS, step=10, radius=2):
+    """기본값과, 슬라이더 하나만 step 단위로 radius칸 이내 움직인 조합"""
+    yield tuple(base)
+    for i, offset in itertools.product(range(len(base)), range(-radius, radius + 1)):
+        value = base[i] + offset * step
+        if offset and 0 <= value <= 100:
+            yield tuple(base[:i]) + (value,) + tuple(base[i + 1:])
+
+
+class RecommendationCache:
+    def __init__(self, recommender, maxsize=4096):
+        # recommender: top_k(user_vector, holland_code, k) 를 가진 객체를 돌려주는 함수 (첫 miss 때 생성)
+        self._recommender = recommender
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def top_k(self, holland_code, weights, k=5):
+        """상위 k개 직업 인덱스 튜플"""
+        key = cache_key(holland_code, weights, k)
+        with self._lock:
+            result = self._entries.get(key)
+            if result is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return result
+            self.misses += 1
+
+        # 계산은 잠금 밖에서 (같은 키가 동시에 계산돼도 결과는 동일)
+        top = self._recommender().top_k(normalize_weights(key[1]), holland_code, k)
+        result = tuple(top.tolist())
+        self._store(key, result)
+        return result
+
+    def _store(self, key, result):
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def warm_up(self, holland_codes, weights=None, k=5):
+        """자주 쓰이는 키를 미리 계산 (카운터에는 반영하지 않음)"""
+        recommender = self._recommender()
+        for code, w in itertools.product(holland_codes, weights or list(common_weights())):
+            key = cache_key(code, w, k)
+            if key not in self._entries:
+                self._store(key, tuple(recommender.top_k(normalize_weights(key[1]), code, k).tolist()))
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self._entries),
+                'maxsize': self.maxsize,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+            }
@@ -0,0 +1,91 @@
+import threading
+from functools import cached_property
+from types import MappingProxyType
+
+from compass.cache import RecommendationCache
+from compass.data import CAREER_GUIDE, JOBS, QUESTIONS
+from compass.guide import GuideStore
+from compass.holland import HOLLAND_CODES
+from compass.render import question_blocks
+
+# -----------------------------------------------------------------------------
+# 읽기 전용 카탈로그 (질문 + 직업 + 진로 가이드 저장소)
+# -----------------------------------------------------------------------------
+# 프로세스당 한 번 만들어 모든 세션이 같은 객체를 공유합니다.
+# (st.cache_data는 rerun마다 깊은 복사본을 돌려주므로 동시 접속이 많으면 메모리/지연이 커짐)
+# 공유 객체이므로 dict -> MappingProxyType, list -> tuple 로 고정해 실수로 수정할 수 없게 합니다.
+# (numpy 배열 컬럼은 읽기 전용 메모리 맵 그대로 둠)
+
+# 직업 수가 이 이상일 때만 추천에 버킷 인덱스(ValueIndex)를 사용하고, 카탈로그를 불러올 때 미리 생성
+# (bench_index 기준 1만 개 안팎은 전수 계산 대비 1.0~1.4배로 들쭉날쭉, 16k부터 꾸준히 1.3배 이상)
+# 그보다 작은 카탈로그는 전수 계산으로 충분하므로 numpy도 STEP 3에서 처음 필요할 때 불러옴
+INDEX_MIN_JOBS = 16384
+
+
+def freeze(obj):
+    if isinstance(obj, dict):
+        return MappingProxyType({k: freeze(v) for k, v in obj.items()})
+    if isinstance(obj, (list, tuple)):
+        return tuple(freeze(v) for v in obj)
+    return obj
+
+
+class Catalog:
+    def __init__(self, questions, jobs, guides, scorer=None, source='builtin'):
+        self.questions = freeze(questions)
+        self.jobs = freeze(jobs)
+        # guides: GuideStore, 또는 {직업명: 가이드} 매핑
+        self.guides = guides if isinstance(guides, GuideStore) else GuideStore.from_mapping(freeze(guides))
+        self.source = source
+        # scorer: JobScorer를 만드는 함수 (디스크 캐시에서 불러온 경우, STEP 3에서 처음 필요할 때 호출)
+        self._scorer = scorer
+        self._recommender = None
+        self._lock = threading.Lock()
+        # 세션 공유 추천 결과 캐시 (카탈로그가 바뀌면 캐시도 함께 교체됨)
+        self.recommendations = RecommendationCache(self.recommender)
+
+    @classmethod
+    def builtin(cls):
+        return cls(QUESTIONS, JOBS, CAREER_GUIDE)
+
+    def __len__(self):
+        return len(self.jobs['직업군'])
+
+    @cached_property
+    def question_blocks(self):
+        """STEP 1 문항 HTML (모든 세션 공유)"""
+        return question_blocks(self.questions)
+
+    def cache_stats(self):
+        """[(캐시 이름, 적중, miss)] - 세션 공유 추천 캐시 / 가이드 LRU"""
+        guides = self.guides.cache_info()
+        return [
+            ('recommendations', self.recommendations.hits, self.recommendations.misses),
+            ('guides', guides.hits, guides.misses),
+        ]
+
+    def recommender(self):
+        """추천 인덱스 (numpy 기반이라 처음 필요할 때 한 번만 생성)"""
+        if self._recommender is None:
+            with self._lock:
+                if self._recommender is None:
+                    from compass.recommend import JobScorer
+                    from compass.spatial import ValueIndex
+
+                    scorer = self._scorer() if self._scorer else JobScorer.from_columns(self.jobs)
+                    self._recommender = ValueIndex(scorer, brute_force_below=INDEX_MIN_JOBS)
+        return self._recommender
+
+    def prepare(self):
+        """큰 카탈로그는 추천 인덱스를 지금 생성 (STEP 3 첫 rerun이 인덱스 생성을 기다리지 않도록)"""
+        if len(self) >= INDEX_MIN_JOBS:
+            self.recommender()
+
+    def warm_up(self, background=True):
+        """홀란드 코드 30개 x 자주 쓰는 슬라이더 조합을 미리 계산"""
+        if not background:
+            self.recommendations.warm_up(HOLLAND_CODES)
+            return None
+        thread = threading.Thread(target=self.recommendations.warm_up, args=(HOLLAND_CODES,), daemon=True)
+        thread.start()
+        return thread
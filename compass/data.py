@@ -0,0 +1,87 @@
+# -----------------------------------------------------------------------------
+# 기본 데이터 (구글 시트 질문 + 직업 데이터 + 상세 진로 가이드)
+# -----------------------------------------------------------------------------
+# Streamlit/pandas 없이도 쓸 수 있도록 순수 파이썬 자료형으로 보관합니다.
+
+# 1. 구글 시트 질문 데이터 (하드코딩 - 연동 실패 시 안전장치)
+# 실제로는 gsheets connection을 쓰면 좋지만, 여기서는 요청하신 데이터를 그대로 넣었습니다.
+QUESTIONS = [
+    {"id": "Q1", "text": "드론, 3D 프린터 등 새로운 기계를 조작하고 결과물을 만드는 것이 즐겁다.", "type": "R"},
+    {"id": "Q2", "text": "가구 조립이나 전자제품 수리처럼 손끝의 감각을 사용하는 일을 잘한다.", "type": "R"},
+    {"id": "Q3", "text": "실내에 앉아있는 것보다 야외에서 몸을 움직이며 땀 흘리는 활동을 선호한다.", "type": "R"},
+    {"id": "Q4", "text": "식물을 키우거나 동물을 돌보는 등 생명체를 다루는 일에 관심이 있다.", "type": "R"},
+    {"id": "Q5", "text": "복잡한 설계도나 지도를 보고 입체적인 구조를 파악하는 것이 빠르다.", "type": "R"},
+    {"id": "Q6", "text": "운동 경기에서 전략보다는 신체적인 능력과 기술을 발휘하는 포지션이 좋다.", "type": "R"},
+    {"id": "Q7", "text": "사회 이슈나 자연 현상을 볼 때 '근본적인 원인'이 무엇인지 분석하려 한다.", "type": "I"},
+    {"id": "Q8", "text": "수학 난제나 추리 소설의 범인을 찾을 때까지 끈질기게 파고든다.", "type": "I"},
+    {"id": "Q9", "text": "객관적인 데이터와 통계 자료를 근거로 주장하는 것을 선호한다.", "type": "I"},
+    {"id": "Q10", "text": "인공지능, 우주, 뇌과학 등 미지의 영역을 탐구하는 다큐멘터리를 즐겨 본다.", "type": "I"},
+    {"id": "Q11", "text": "실험을 통해 가설을 검증하고 새로운 사실을 발견했을 때 희열을 느낀다.", "type": "I"},
+    {"id": "Q12", "text": "논리적 모순을 찾아내거나 비판적으로 사고하는 토론 수업이 재미있다.", "type": "I"},
+    {"id": "Q13", "text": "정해진 양식보다는 나만의 스타일로 PPT나 보고서를 꾸미는 것을 좋아한다.", "type": "A"},
+    {"id": "Q14", "text": "글, 그림, 영상, 음악 등을 통해 나의 감정을 표현하는 것이 익숙하다.", "type": "A"},
+    {"id": "Q15", "text": "남들이 생각하지 못한 기발한 아이디어로 친구들을 놀라게 한 적이 있다.", "type": "A"},
+    {"id": "Q16", "text": "자유로운 분위기에서 상상력을 발휘할 수 있는 환경을 선호한다.", "type": "A"},
+    {"id": "Q17", "text": "영화나 소설을 볼 때 등장인물의 감정에 깊이 이입하여 눈물을 흘리곤 한다.", "type": "A"},
+    {"id": "Q18", "text": "유행을 따르기보다 나만의 개성이 드러나는 옷이나 소품을 좋아한다.", "type": "A"},
+    {"id": "Q19", "text": "친구의 고민을 들어주고 그들의 감정을 위로해 주는 데서 보람을 느낀다.", "type": "S"},
+    {"id": "Q20", "text": "어려운 개념을 친구들이 이해하기 쉽게 설명해 주는 것을 잘한다.", "type": "S"},
+    {"id": "Q21", "text": "봉사활동이나 멘토링처럼 타인의 성장을 돕는 활동에 적극적이다.", "type": "S"},
+    {"id": "Q22", "text": "혼자 일하는 것보다 팀원들과 협력하여 시너지를 내는 것을 선호한다.", "type": "S"},
+    {"id": "Q23", "text": "사회적 약자나 인권 문제에 관심이 많고 이를 개선하고 싶다.", "type": "S"},
+    {"id": "Q24", "text": "낯선 사람과도 금방 친해지고 대화를 이끌어가는 사교성이 있다.", "type": "S"},
+    {"id": "Q25", "text": "학급 회장이나 동아리 대표처럼 리더십을 발휘하는 자리가 편하다.", "type": "E"},
+    {"id": "Q26", "text": "목표를 달성하기 위해 사람들을 설득하고 협상하는 과정이 즐겁다.", "type": "E"},
+    {"id": "Q27", "text": "실패를 두려워하기보다 도전적인 과제에 부딪혀 성취하는 것을 즐긴다.", "type": "E"},
+    {"id": "Q28", "text": "나의 노력에 따라 보상이 확실하게 주어지는 경쟁적인 환경을 선호한다.", "type": "E"},
+    {"id": "Q29", "text": "경제 흐름, 창업, 마케팅 전략 등 비즈니스 세계에 관심이 많다.", "type": "E"},
+    {"id": "Q30", "text": "대중 앞에서 나의 의견을 발표하고 주목받는 것을 즐긴다.", "type": "E"},
+    {"id": "Q31", "text": "계획을 세워 시간과 돈을 체계적으로 관리하는 습관이 있다.", "type": "C"},
+    {"id": "Q32", "text": "문서의 오타를 찾거나 숫자를 정확하게 계산하는 꼼꼼함이 있다.", "type": "C"},
+    {"id": "Q33", "text": "정해진 규칙과 매뉴얼을 준수하며 안정적으로 일하는 것을 선호한다.", "type": "C"},
+    {"id": "Q34", "text": "복잡한 자료를 보기 좋게 정리하고 분류하는 것을 잘한다.", "type": "C"},
+    {"id": "Q35", "text": "예측 불가능한 모험보다는 확실하고 안전한 선택을 하는 편이다.", "type": "C"},
+    {"id": "Q36", "text": "책임감이 강하고 맡은 일은 끝까지 성실하게 마무리한다.", "type": "C"},
+]
+
+# 2. 직업 데이터 (컬럼별 리스트)
+JOBS = {
+    '직업군': [
+        '소프트웨어 개발자', '데이터 사이언티스트', '정보보안 전문가', 'AI 연구원', '반도체 엔지니어',
+        '의사 (전문의)', '약사', '간호사', '수의사', '치과의사',
+        '경영 컨설턴트', '공인회계사(CPA)', '투자은행가(IB)', '마케팅 전문가', '관세사',
+        '변호사 (로스쿨)', '판사/검사', '변리사', '노무사', '경찰공무원',
+        '5급 행정고시', '7/9급 공무원', '외교관', '중등 교사', '대학교수',
+        '방송 PD', '기자', '웹툰 작가', '큐레이터', '항공기 조종사'
+    ],
+    'Holland_Code': [
+        'IR', 'IC', 'IC', 'IR', 'RI',
+        'IS', 'SC', 'SI', 'IR', 'IR',
+        'EC', 'CE', 'EC', 'AE', 'CE',
+        'EI', 'EI', 'IE', 'ES', 'SE',
+        'ES', 'CS', 'SA', 'SA', 'IA',
+        'AE', 'EI', 'AI', 'AE', 'RI'
+    ],
+    'Money': [45, 50, 45, 50, 50, 60, 45, 35, 45, 55, 55, 50, 60, 35, 40, 55, 50, 50, 40, 30, 35, 25, 40, 30, 40, 35, 30, 40, 25, 55],
+    'WLB':   [25, 25, 20, 20, 15, 10, 35, 15, 25, 25, 5, 10, 5, 25, 30, 5, 10, 15, 30, 15, 15, 35, 15, 35, 35, 5, 5, 20, 30, 20],
+    'Culture':[35, 30, 25, 25, 15, 10, 15, 10, 15, 15, 10, 15, 5, 40, 15, 10, 5, 15, 20, 5, 10, 10, 15, 15, 20, 30, 20, 40, 25, 10],
+    'Location':[15, 15, 15, 10, 10, 20, 20, 25, 20, 20, 25, 25, 25, 20, 20, 25, 20, 20, 20, 10, 30, 15, 10, 15, 10, 25, 20, 10, 20, 10],
+    'Stability':[20, 25, 30, 25, 30, 60, 50, 40, 50, 55, 15, 40, 10, 15, 40, 30, 50, 45, 35, 50, 55, 60, 50, 55, 50, 20, 25, 10, 20, 40]
+}
+
+# 3. 상세 진로 가이드 (일부 예시)
+CAREER_GUIDE = {
+    "소프트웨어 개발자": {"major": "컴퓨터공학, 소프트웨어학", "hs_g": "수학I/II, 미적분, 물리학I, 정보", "hs_c": "인공지능 수학, 정보과학", "steps": ["CS 기초(자료구조/알고리즘)", "나만의 웹/앱 프로젝트 배포", "코딩테스트 및 기술면접"]},
+    "데이터 사이언티스트": {"major": "통계학, 산업공학, 데이터사이언스", "hs_g": "확률과 통계, 미적분, 사회문제탐구", "hs_c": "실용 통계, 수학과제 탐구", "steps": ["Python/SQL 및 통계학 마스터", "Kaggle 등 분석 대회 참여", "석사 진학 또는 실무 프로젝트"]},
+    "의사 (전문의)": {"major": "의예과", "hs_g": "생명과학I, 화학I, 미적분", "hs_c": "생명과학II, 화학II", "steps": ["의대 6년(예과+본과)", "의사 국가고시 합격", "인턴 1년 + 레지던트 3~4년"]},
+    "경영 컨설턴트": {"major": "경영학, 경제학, 산업공학", "hs_g": "경제, 사회문화, 영어회화", "hs_c": "국제 경제, 사회문제 탐구", "steps": ["전략 학회 활동 및 공모전", "RA(Research Assistant) 인턴", "Case Interview 준비"]},
+    "5급 행정고시": {"major": "행정학, 경제학, 정치외교", "hs_g": "정치와 법, 한국사, 경제", "hs_c": "국제 정치, 지역 이해", "steps": ["PSAT(1차) 및 한국사/영어", "2차 전공 논술(경제/행정법)", "3차 심층 면접"]},
+    "반도체 엔지니어": {"major": "전자공학, 신소재공학", "hs_g": "물리학I/II, 화학I, 미적분", "hs_c": "공학 일반, 고급 물리학", "steps": ["회로이론/반도체공학 학점 관리", "반도체 공정 실습 경험", "대기업 직무적성검사(GSAT 등)"]},
+    "공인회계사(CPA)": {"major": "경영학, 회계학, 세무학", "hs_g": "경제, 확률과 통계", "hs_c": "경제 수학, 실용 경제", "steps": ["학점 이수 및 토익 점수 확보", "1차 시험(객관식)", "2차 시험(서술형)"]},
+    "변호사 (로스쿨)": {"major": "자유전공, 정치외교, 경제", "hs_g": "정치와 법, 생활과 윤리, 화작", "hs_c": "사회문제 탐구, 고전 읽기", "steps": ["학점(GPA) 및 토익 고득점", "LEET(법학적성시험) 준비", "로스쿨 3년 + 변호사 시험"]},
+    "중등 교사": {"major": "사범대학(해당 전공)", "hs_g": "교육학(선택), 전공 관련 과목", "hs_c": "교육학, 심리학", "steps": ["교원 자격증 취득", "임용고시 1차(교육학/전공)", "임용고시 2차(수업실연/면접)"]},
+    "방송 PD": {"major": "신문방송학, 미디어커뮤니케이션", "hs_g": "언어와 매체, 사회문화", "hs_c": "매체와 비평, 영상 제작", "steps": ["영상 제작 경험(동아리/유튜브)", "작문/논술(언론고시) 준비", "실무 면접 및 기획안 평가"]},
+    "약사": {"major": "약학과", "hs_g": "화학I, 생명과학I, 미적분", "hs_c": "화학II, 융합과학 탐구", "steps": ["약대 6년 과정 입학", "약학 필수 실무 실습", "약사 면허 시험 합격"]},
+    "간호사": {"major": "간호학과", "hs_g": "생명과학I, 생활과 윤리", "hs_c": "보건 간호, 인체 구조와 기능", "steps": ["간호학과 4년 졸업", "간호사 국가고시 합격", "대학병원/종합병원 취업"]},
+    "항공기 조종사": {"major": "항공운항학과", "hs_g": "물리학I, 지구과학I, 영어", "hs_c": "고급 지구과학", "steps": ["비행 교육원 입교 및 면장 취득", "비행 시간(타임빌딩) 축적", "항공사 입사"]},
+}
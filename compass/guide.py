@@ -0,0 +1,88 @@
+import json
+import sqlite3
+import threading
+from collections import namedtuple
+from functools import lru_cache
+
+from compass.render import guide_boxes
+
+# -----------------------------------------------------------------------------
+# 상세 진로 가이드 저장소 (STEP 3)
+# -----------------------------------------------------------------------------
+# 가이드 전체를 메모리에 올리지 않고, 직업명 인덱스(SQLite PRIMARY KEY)로 필요한 항목만 읽습니다.
+# 최근에 본 직업은 LRU에 보관하고, 과목 태그/정보 상자 HTML과 로드맵 문구도 함께 만들어 둡니다.
+# 가이드가 없는 직업("준비 중")은 인덱스 조회 한 번으로 끝납니다.
+
+GUIDE_FIELDS = ('major', 'hs_g', 'hs_c', 'steps')
+
+# info: 원본 가이드, boxes: (전공, 일반선택, 진로선택) info-box HTML, steps: 로드맵 문구
+RenderedGuide = namedtuple('RenderedGuide', ['info', 'boxes', 'steps'])
+
+
+def subjects(text):
+    """'물리학I, 화학I' 형식의 과목 문자열을 목록으로"""
+    return text.split(', ')
+
+
+def write_sqlite(path, guide):
+    """{직업명: 가이드} 를 SQLite 파일로 기록"""
+    with sqlite3.connect(path) as conn:
+        conn.execute(
+            "CREATE TABLE guides (name TEXT PRIMARY KEY, major TEXT, hs_g TEXT, hs_c TEXT, steps TEXT) WITHOUT ROWID"
+        )
+        conn.executemany(
+            "INSERT INTO guides VALUES (?, ?, ?, ?, ?)",
+            ((name, info['major'], info['hs_g'], info['hs_c'], json.dumps(info['steps'], ensure_ascii=False))
+             for name, info in guide.items()),
+        )
+    conn.close()
+
+
+class GuideStore:
+    def __init__(self, fetch, maxsize=256):
+        # fetch: 직업명 -> 가이드 dict (없으면 None)
+        self._fetch = fetch
+        self._rendered = lru_cache(maxsize=maxsize)(self._render)
+
+    @classmethod
+    def from_mapping(cls, guide, maxsize=256):
+        """메모리에 있는 dict (내장 데이터, 캐시 없이 파싱한 경우)"""
+        return cls(guide.get, maxsize)
+
+    @classmethod
+    def from_sqlite(cls, path, maxsize=256):
+        # 캐시 파일은 만든 뒤 바뀌지 않으므로 immutable 모드(잠금/저널 확인 생략)로 연결을 하나만 열어 공유
+        conn = sqlite3.connect(f"file:{path}?mode=ro&immutable=1", uri=True, check_same_thread=False)
+        lock = threading.Lock()
+
+        def fetch(name):
+            with lock:
+                row = conn.execute("SELECT major, hs_g, hs_c, steps FROM guides WHERE name = ?", (name,)).fetchone()
+            if row is None:
+                return None
+            major, hs_g, hs_c, steps = row
+            return {'major': major, 'hs_g': hs_g, 'hs_c': hs_c, 'steps': tuple(json.loads(steps))}
+
+        return cls(fetch, maxsize)
+
+    def _render(self, name):
+        info = self._fetch(name)
+        if info is None:
+            return None
+        steps = tuple(f"**STEP {idx+1}** : {step_text}" for idx, step_text in enumerate(info['steps']))
+        return RenderedGuide(info, guide_boxes(info['major'], subjects(info['hs_g']), subjects(info['hs_c'])), steps)
+
+    def get(self, name):
+        """직업의 가이드 (준비 중이면 None)"""
+        rendered = self._rendered(name)
+        return rendered.info if rendered else None
+
+    def rendered(self, name):
+        """화면에 바로 쓸 수 있는 RenderedGuide (준비 중이면 None)"""
+        return self._rendered(name)
+
+    def __contains__(self, name):
+        return self._rendered(name) is not None
+
+    def cache_info(self):
+        return self._rendered.cache_info()
@@ -0,0 +1,23 @@
+# -----------------------------------------------------------------------------
+# 홀란드(RIASEC) 적성 검사 채점 (STEP 1)
+# -----------------------------------------------------------------------------
+
+HOLLAND_TYPES = 'RIASEC'
+# 가능한 홀란드 코드 (서로 다른 두 유형의 순서쌍 30가지)
+HOLLAND_CODES = [a + b for a in HOLLAND_TYPES for b in HOLLAND_TYPES if a != b]
+DEFAULT_ANSWER = 3  # 라디오 기본값 (3점)
+
+
+def tally(answers, questions, default=DEFAULT_ANSWER):
+    """문항 id -> 응답(1~5점) 매핑을 유형별 점수 합계로 변환"""
+    scores = {t: 0 for t in HOLLAND_TYPES}
+    for q in questions:
+        val = answers.get(q['id'], default)
+        scores[q['type']] += val
+    return scores
+
+
+def holland_code(scores):
+    """점수 상위 2개 유형 코드 (동점이면 RIASEC 순서)"""
+    sorted_scores = sorted(scores.items(), key=lambda x: x[1], reverse=True)
+    return sorted_scores[0][0] + sorted_scores[1][0]
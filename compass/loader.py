@@ -0,0 +1,335 @@
+import csv
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import time
+
+from compass.catalog import Catalog
+from compass.guide import GUIDE_FIELDS, GuideStore, write_sqlite
+from compass.holland import HOLLAND_TYPES
+from compass.values import VALUE_COLUMNS
+
+# -----------------------------------------------------------------------------
+# 외부 파일 카탈로그 + 디스크 컬럼 캐시 + 핫 리로드
+# -----------------------------------------------------------------------------
+# data/
+#   questions.csv      : id,text,type   (구글 시트 '파일 > 다운로드 > CSV' 내보내기 형식)
+#   jobs.csv           : 직업군,Holland_Code,Money,WLB,Culture,Location,Stability
+#   career_guide.json  : {직업명: {major, hs_g, hs_c, steps}}
+#   .cache/<내용 해시>/ : 파싱 결과를 컬럼별 .npy + 가이드 SQLite로 저장 (다음 기동 때 메모리 맵으로 바로 사용)
+#
+# 파일을 고치면 CatalogStore가 (mtime, 크기) 변화를 감지해 백그라운드에서 새 카탈로그를 만들고
+# 참조 하나만 바꿔 끼웁니다. 진행 중인 세션은 들고 있던 이전 카탈로그로 rerun을 마칩니다.
+
+log = logging.getLogger(__name__)
+
+SOURCE_FILES = ('questions.csv', 'jobs.csv', 'career_guide.json')
+CACHE_DIR = '.cache'
+CACHE_FORMAT = 4
+JOB_NAME_COLUMN = '직업군'
+HOLLAND_COLUMN = 'Holland_Code'
+
+
+def source_signature(data_dir):
+    """원본 파일들의 (이름, mtime_ns, 크기) - 파일이 하나라도 없으면 None"""
+    signature = []
+    for name in SOURCE_FILES:
+        try:
+            st = os.stat(os.path.join(data_dir, name))
+        except FileNotFoundError:
+            return None
+        signature.append([name, st.st_mtime_ns, st.st_size])
+    return signature
+
+
+def source_hash(data_dir):
+    digest = hashlib.sha256(f"format {CACHE_FORMAT}".encode())
+    for name in SOURCE_FILES:
+        with open(os.path.join(data_dir, name), 'rb') as f:
+            digest.update(name.encode())
+            digest.update(f.read())
+    return digest.hexdigest()[:20]
+
+
+# --- 파싱 ---------------------------------------------------------------------
+
+def _read_csv(path, columns):
+    # 구글 시트/엑셀에서 내보낸 CSV는 BOM이 붙어 있는 경우가 많음
+    with open(path, encoding='utf-8-sig', newline='') as f:
+        reader = csv.DictReader(f)
+        missing = [c for c in columns if c not in (reader.fieldnames or ())]
+        if missing:
+            raise ValueError(f"{path}: missing column {', '.join(missing)}")
+        yield from enumerate(reader, start=2)
+
+
+def parse_questions(path):
+    questions = []
+    seen = set()
+    for line_no, row in _read_csv(path, ('id', 'text', 'type')):
+        qid = (row['id'] or '').strip()
+        if not qid:
+            raise ValueError(f"{path}:{line_no}: missing question id")
+        if qid in seen:
+            # 문항 id는 STEP 1 위젯 키(q_<id>)로 쓰이므로 중복되면 화면을 그릴 수 없음
+            raise ValueError(f"{path}:{line_no}: duplicate question id {qid!r}")
+        seen.add(qid)
+        qtype = (row['type'] or '').strip()
+        if len(qtype) != 1 or qtype not in HOLLAND_TYPES:
+            raise ValueError(f"{path}:{line_no}: unknown question type {qtype!r}")
+        questions.append({"id": qid, "text": (row['text'] or '').strip(), "type": qtype})
+    if not questions:
+        raise ValueError(f"{path}: no questions")
+    return questions
+
+
+def parse_jobs(path):
+    jobs = {JOB_NAME_COLUMN: [], HOLLAND_COLUMN: []}
+    jobs.update({c: [] for c in VALUE_COLUMNS})
+    seen = set()
+    for line_no, row in _read_csv(path, (JOB_NAME_COLUMN, HOLLAND_COLUMN, *VALUE_COLUMNS)):
+        name = (row[JOB_NAME_COLUMN] or '').strip()
+        if not name:
+            raise ValueError(f"{path}:{line_no}: missing job name")
+        if name in seen:
+            # 직업명은 진로 가이드 조회 키이자 STEP 3 선택 상자 항목으로 쓰임
+            raise ValueError(f"{path}:{line_no}: duplicate job name {name!r}")
+        seen.add(name)
+        code = (row[HOLLAND_COLUMN] or '').strip()
+        if not code or any(letter not in HOLLAND_TYPES for letter in code):
+            raise ValueError(f"{path}:{line_no}: invalid Holland_Code {code!r}")
+        jobs[JOB_NAME_COLUMN].append(name)
+        jobs[HOLLAND_COLUMN].append(code)
+        for c in VALUE_COLUMNS:
+            try:
+                jobs[c].append(int(row[c]))
+            except (TypeError, ValueError):
+                raise ValueError(f"{path}:{line_no}: {c}={row[c]!r} is not an integer") from None
+    if not jobs[JOB_NAME_COLUMN]:
+        raise ValueError(f"{path}: no jobs")
+    return jobs
+
+
+def parse_guide(path):
+    with open(path, encoding='utf-8') as f:
+        guide = json.load(f)
+    if not isinstance(guide, dict):
+        raise ValueError(f"{path}: expected an object of {{job name: guide}}")
+    for name, info in guide.items():
+        if not isinstance(info, dict):
+            raise ValueError(f"{path}: {name}: expected an object with {', '.join(GUIDE_FIELDS)}")
+        missing = [field for field in GUIDE_FIELDS if field not in info]
+        if missing:
+            raise ValueError(f"{path}: {name}: missing {', '.join(missing)}")
+        for field in ('major', 'hs_g', 'hs_c'):
+            if not isinstance(info[field], str):
+                raise ValueError(f"{path}: {name}: {field}={info[field]!r} is not a string")
+        steps = info['steps']
+        if not isinstance(steps, list) or not all(isinstance(step, str) for step in steps):
+            raise ValueError(f"{path}: {name}: steps must be a list of strings")
+    return guide
+
+
+def parse_sources(data_dir):
+    return (
+        parse_questions(os.path.join(data_dir, 'questions.csv')),
+        parse_jobs(os.path.join(data_dir, 'jobs.csv')),
+        parse_guide(os.path.join(data_dir, 'career_guide.json')),
+    )
+
+
+# --- 컬럼 캐시 ----------------------------------------------------------------
+
+def compile_cache(data_dir, key, questions, jobs, guide):
+    """파싱 결과를 .cache/<key>/ 에 기록 (임시 디렉터리에 쓴 뒤 이름 변경으로 원자적 교체)"""
+    import numpy as np
+
+    from compass.recommend import holland_mask
+
+    cache_root = os.path.join(data_dir, CACHE_DIR)
+    if not os.path.isdir(cache_root):
+        os.makedirs(cache_root, exist_ok=True)
+        os.chmod(cache_root, 0o755)
+    tmp = tempfile.mkdtemp(prefix='tmp-', dir=cache_root)
+    try:
+        np.save(os.path.join(tmp, 'names.npy'), np.array(jobs[JOB_NAME_COLUMN], dtype=str))
+        np.save(os.path.join(tmp, 'codes.npy'), np.array(jobs[HOLLAND_COLUMN], dtype=str))
+        values = np.column_stack([np.asarray(jobs[c], dtype=np.float32) for c in VALUE_COLUMNS])
+        np.save(os.path.join(tmp, 'values.npy'), values.reshape(-1, len(VALUE_COLUMNS)))
+        masks = np.array([holland_mask(c) for c in jobs[HOLLAND_COLUMN]], dtype=np.uint8)
+        np.save(os.path.join(tmp, 'masks.npy'), masks)
+        with open(os.path.join(tmp, 'questions.json'), 'w', encoding='utf-8') as f:
+            json.dump(questions, f, ensure_ascii=False)
+        write_sqlite(os.path.join(tmp, 'guide.sqlite'), guide)
+        # mkdtemp는 0700으로 만들므로, 다른 사용자(배포 계정 등)가 만든 캐시도 읽을 수 있게 권한을 명시
+        for name in os.listdir(tmp):
+            os.chmod(os.path.join(tmp, name), 0o644)
+        os.chmod(tmp, 0o755)
+        try:
+            os.rename(tmp, os.path.join(cache_root, key))
+        except OSError:
+            # 다른 프로세스가 같은 내용을 먼저 만든 경우
+            shutil.rmtree(tmp, ignore_errors=True)
+    except BaseException:
+        shutil.rmtree(tmp, ignore_errors=True)
+        raise
+
+
+def open_cache(data_dir, key, source):
+    """.cache/<key>/ 를 메모리 맵으로 열어 Catalog 생성 (파싱 없음)"""
+    import numpy as np
+
+    path = os.path.join(data_dir, CACHE_DIR, key)
+    names = np.load(os.path.join(path, 'names.npy'), mmap_mode='r')
+    codes = np.load(os.path.join(path, 'codes.npy'), mmap_mode='r')
+    values = np.load(os.path.join(path, 'values.npy'), mmap_mode='r')
+    masks = np.load(os.path.join(path, 'masks.npy'), mmap_mode='r')
+    with open(os.path.join(path, 'questions.json'), encoding='utf-8') as f:
+        questions = json.load(f)
+
+    # 가이드는 직업명 인덱스로 필요한 항목만 읽음 (연결을 지금 열어 두므로 이후 캐시가 교체/삭제돼도 읽을 수 있음)
+    guides = GuideStore.from_sqlite(os.path.join(path, 'guide.sqlite'))
+
+    jobs = {JOB_NAME_COLUMN: names, HOLLAND_COLUMN: codes}
+    jobs.update({c: values[:, i] for i, c in enumerate(VALUE_COLUMNS)})
+
+    # 메모리 맵은 지금 열어 두고(이후 캐시가 교체/삭제돼도 읽을 수 있음), 추천 엔진 모듈은 STEP 3에서 처음 필요할 때 불러옴
+    def scorer():
+        from compass.recommend import JobScorer
+
+        return JobScorer(names, codes, values, masks)
+
+    return Catalog(questions, jobs, guides, scorer=scorer, source=source)
+
+
+def _write_pointer(data_dir, signature, key):
+    # 다음 기동 때 파일 내용을 다시 해시하지 않도록 (mtime, 크기) -> 캐시 키 기록
+    cache_root = os.path.join(data_dir, CACHE_DIR)
+    fd, tmp = tempfile.mkstemp(prefix='tmp-', suffix='.json', dir=cache_root)
+    try:
+        # mkstemp는 0600으로 만들므로 다른 사용자도 읽을 수 있게 권한을 명시
+        os.fchmod(fd, 0o644)
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump({"format": CACHE_FORMAT, "signature": signature, "key": key}, f)
+        os.replace(tmp, os.path.join(cache_root, 'current.json'))
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def _read_pointer(data_dir):
+    try:
+        with open(os.path.join(data_dir, CACHE_DIR, 'current.json'), encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError):
+        # 권한이 없거나 깨진 포인터는 없는 것으로 보고 캐시 키를 다시 계산
+        log.warning("cannot read catalog cache pointer in %s", data_dir, exc_info=True)
+        return {}
+
+
+def _remove_stale(data_dir, keep):
+    # 이미 메모리 맵으로 열려 있는 파일은 삭제해도 열어 둔 프로세스에서는 계속 읽을 수 있음
+    cache_root = os.path.join(data_dir, CACHE_DIR)
+    for name in os.listdir(cache_root):
+        path = os.path.join(cache_root, name)
+        if name != keep and os.path.isdir(path) and not name.startswith('tmp-'):
+            shutil.rmtree(path, ignore_errors=True)
+
+
+def load_catalog(data_dir, use_cache=True):
+    """data_dir의 파일로 Catalog 생성. 파일이 없으면 내장 데이터(compass.data)로 대체"""
+    signature = source_signature(data_dir)
+    if signature is None:
+        log.info("catalog files not found in %s, using built-in data", data_dir)
+        return Catalog.builtin()
+    if not use_cache:
+        questions, jobs, guide = parse_sources(data_dir)
+        return Catalog(questions, jobs, guide, source=data_dir)
+
+    pointer = _read_pointer(data_dir)
+    key = pointer.get('key')
+    if (pointer.get('format') != CACHE_FORMAT or pointer.get('signature') != signature
+            or not os.path.isdir(os.path.join(data_dir, CACHE_DIR, key or ''))):
+        key = source_hash(data_dir)
+        if not os.path.isdir(os.path.join(data_dir, CACHE_DIR, key)):
+            sources = parse_sources(data_dir)
+            try:
+                compile_cache(data_dir, key, *sources)
+            except OSError:
+                # 읽기 전용 배포 등으로 캐시를 쓸 수 없으면 파싱 결과를 그대로 사용
+                log.warning("cannot write catalog cache in %s, using parsed data", data_dir, exc_info=True)
+                return Catalog(*sources, source=data_dir)
+            _remove_stale(data_dir, keep=key)
+        try:
+            _write_pointer(data_dir, signature, key)
+        except OSError:
+            log.warning("cannot update catalog cache pointer in %s", data_dir, exc_info=True)
+    try:
+        return open_cache(data_dir, key, source=f"{data_dir}@{key}")
+    except OSError:
+        # 다른 사용자가 만든 캐시를 읽을 권한이 없는 경우 등 - 원본 파일을 파싱해서 사용
+        log.warning("cannot open catalog cache %s in %s, using parsed data", key, data_dir, exc_info=True)
+        questions, jobs, guide = parse_sources(data_dir)
+        return Catalog(questions, jobs, guide, source=data_dir)
+
+
+# --- 핫 리로드 ----------------------------------------------------------------
+
+class CatalogStore:
+    def __init__(self, data_dir, check_interval=2.0, on_load=None):
+        self.data_dir = data_dir
+        self.check_interval = check_interval
+        self.on_load = on_load
+        self._signature = source_signature(data_dir)
+        self._current = self._load()
+        self._last_check = time.monotonic()
+        self._reloading = threading.Lock()
+        self.reloads = 0
+
+    def _load(self):
+        catalog = load_catalog(self.data_dir)
+        # 리로드는 백그라운드 스레드에서 실행되므로 인덱스 생성 동안에도 세션은 이전 카탈로그로 계속 응답
+        catalog.prepare()
+        if self.on_load:
+            self.on_load(catalog)
+        return catalog
+
+    def get(self):
+        """현재 카탈로그. check_interval마다 파일 변경을 확인하고, 바뀌었으면 백그라운드에서 교체"""
+        now = time.monotonic()
+        if now - self._last_check >= self.check_interval and self._reloading.acquire(blocking=False):
+            self._last_check = now
+            signature = source_signature(self.data_dir)
+            if signature != self._signature:
+                threading.Thread(target=self._reload, args=(signature,), daemon=True).start()
+            else:
+                self._reloading.release()
+        return self._current
+
+    def _reload(self, signature):
+        try:
+            catalog = self._load()
+        except Exception:
+            # 편집 중인 파일이 잘못돼도 이전 카탈로그로 계속 서비스 (다음 변경 때 다시 시도)
+            log.exception("failed to reload catalog from %s, keeping %s", self.data_dir, self._current.source)
+        else:
+            self._current = catalog  # 참조 교체 한 번 -> 진행 중인 rerun은 이전 카탈로그 그대로 사용
+            self.reloads += 1
+            log.info("catalog reloaded: %s (%d jobs)", catalog.source, len(catalog))
+        finally:
+            self._signature = signature
+            self._reloading.release()
+
+    def reload_now(self):
+        """변경 확인을 기다리지 않고 동기적으로 다시 읽기"""
+        with self._reloading:
+            self._signature = source_signature(self.data_dir)
+            self._current = self._load()
+            self.reloads += 1
+        return self._current
@@ -0,0 +1,211 @@
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections import defaultdict, deque
+from contextlib import nullcontext
+
+# -----------------------------------------------------------------------------
+# rerun 구간별 시간 측정 (COMPASS_PROFILE=1 일 때만)
+# -----------------------------------------------------------------------------
+# app.py의 주요 구간(CSS, 카탈로그 로딩, STEP 1 폼, STEP 2 차트, STEP 3 추천/가이드 ...)을
+# (구간, STEP)별로 기록하고 최근 window개 값으로 p50/p95/p99를 계산합니다.
+# 결과는 Prometheus 텍스트 파일(COMPASS_PROFILE_FILE)이나 관리자 사이드바 패널(?admin=1)로 확인합니다.
+#
+# 꺼져 있으면 NULL_PROFILER가 아무것도 하지 않는 공용 컨텍스트 매니저만 돌려주므로
+# 구간 하나당 비용은 메서드 호출 한 번 정도입니다.
+
+log = logging.getLogger(__name__)
+
+QUANTILES = (0.5, 0.95, 0.99)
+EXPORT_BACKOFF = 6  # 내보내기 실패 후에는 export_interval x 6 동안 다시 시도하지 않음
+_NULL_SECTION = nullcontext()
+
+
+def quantile(sorted_values, q):
+    """정렬된 값의 q 분위수 (nearest-rank)"""
+    index = max(0, min(len(sorted_values) - 1, int(q * len(sorted_values) + 0.5) - 1))
+    return sorted_values[index]
+
+
+class _Section:
+    __slots__ = ('rerun', 'name', 'start')
+
+    def __init__(self, rerun, name):
+        self.rerun = rerun
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        # st.rerun()/st.stop()으로 빠져나가는 경우도 기록
+        self.rerun.add(self.name, time.perf_counter() - self.start)
+        return False
+
+
+class Rerun:
+    """rerun 한 번의 구간 기록"""
+
+    def __init__(self, profiler, step, name='rerun'):
+        self.profiler = profiler
+        self.step = step
+        self.name = name
+        self.start = time.perf_counter()
+        self.sections = []  # [(구간, 초)] - 관리자 패널의 '마지막 rerun' 표
+
+    def section(self, name):
+        return _Section(self, name)
+
+    def add(self, name, seconds):
+        self.sections.append((name, seconds))
+        self.profiler.record(name, self.step, seconds)
+
+    def finish(self):
+        """끝까지 실행된 rerun(또는 fragment)의 전체 시간 기록"""
+        self.add(self.name, time.perf_counter() - self.start)
+        self.profiler.maybe_export()
+
+
+class Profiler:
+    enabled = True
+
+    def __init__(self, window=1024, export_path=None, export_interval=10.0):
+        self.window = window
+        self.export_path = export_path
+        self.export_interval = export_interval
+        self._samples = defaultdict(lambda: deque(maxlen=window))
+        self._count = defaultdict(int)
+        self._sum = defaultdict(float)
+        self._cache = defaultdict(lambda: [0, 0])  # 캐시 이름 -> [요청, miss]
+        self._collectors = []
+        self._lock = threading.Lock()
+        self._next_export = 0.0
+
+    def rerun(self, step, name='rerun'):
+        return Rerun(self, step, name)
+
+    def record(self, name, step, seconds):
+        key = (name, step)
+        with self._lock:
+            self._samples[key].append(seconds)
+            self._count[key] += 1
+            self._sum[key] += seconds
+
+    # --- 캐시 적중률 ----------------------------------------------------------
+
+    def cache_request(self, name):
+        with self._lock:
+            self._cache[name][0] += 1
+
+    def cache_miss(self, name):
+        """캐시된 함수 본문이 실제로 실행될 때 호출"""
+        with self._lock:
+            self._cache[name][1] += 1
+
+    def add_collector(self, collect):
+        """collect() -> [(캐시 이름, 적중, miss)] (추천/가이드 캐시처럼 자체 카운터가 있는 경우)"""
+        self._collectors.append(collect)
+
+    def cache_stats(self):
+        """[(캐시 이름, 적중, miss)]"""
+        with self._lock:
+            stats = [(name, max(requests - misses, 0), misses) for name, (requests, misses) in self._cache.items()]
+        for collect in self._collectors:
+            stats.extend(collect())
+        return stats
+
+    # --- 집계 / 내보내기 ------------------------------------------------------
+
+    def summary(self):
+        """[(구간, STEP, 횟수, 합계(초), {분위수: 초})] (최근 window개 기준 분위수)"""
+        with self._lock:
+            items = [(key, sorted(samples), self._count[key], self._sum[key]) for key, samples in self._samples.items()]
+        rows = []
+        for (name, step), values, count, total in sorted(items, key=lambda item: (str(item[0][1]), item[0][0])):
+            rows.append((name, step, count, total, {q: quantile(values, q) for q in QUANTILES}))
+        return rows
+
+    def prometheus_text(self):
+        lines = [
+            "# HELP compass_section_seconds Time spent in a named app.py section per rerun (rolling window quantiles).",
+            "# TYPE compass_section_seconds summary",
+        ]
+        for name, step, count, total, quantiles in self.summary():
+            labels = f'section="{name}",step="{step}"'
+            for q, value in quantiles.items():
+                lines.append(f'compass_section_seconds{{{labels},quantile="{q}"}} {value:.6f}')
+            lines.append(f"compass_section_seconds_sum{{{labels}}} {total:.6f}")
+            lines.append(f"compass_section_seconds_count{{{labels}}} {count}")
+        lines += [
+            "# HELP compass_cache_requests_total Cache lookups by result.",
+            "# TYPE compass_cache_requests_total counter",
+        ]
+        for name, hits, misses in self.cache_stats():
+            lines.append(f'compass_cache_requests_total{{cache="{name}",result="hit"}} {hits}')
+            lines.append(f'compass_cache_requests_total{{cache="{name}",result="miss"}} {misses}')
+        return "\n".join(lines) + "\n"
+
+    def export(self, path=None):
+        """Prometheus 텍스트 파일로 기록 (node_exporter textfile collector 형식, 임시 파일 후 이름 변경)"""
+        path = path or self.export_path
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, tmp = tempfile.mkstemp(prefix='.compass-', suffix='.prom', dir=directory)
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(self.prometheus_text())
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    def maybe_export(self):
+        """export_interval마다 백그라운드 스레드에서 내보내기 (rerun은 기다리지 않고, 실패해도 영향 없음)"""
+        if not self.export_path:
+            return
+        now = time.monotonic()
+        with self._lock:
+            if now < self._next_export:
+                return
+            self._next_export = now + self.export_interval
+        threading.Thread(target=self._export_in_background, name='compass-profile-export', daemon=True).start()
+
+    def _export_in_background(self):
+        try:
+            self.export()
+        except OSError:
+            with self._lock:
+                self._next_export = time.monotonic() + self.export_interval * EXPORT_BACKOFF
+            log.warning("cannot write profile metrics to %s", self.export_path, exc_info=True)
+
+
+class _NullRerun:
+    sections = ()
+
+    def section(self, name):
+        return _NULL_SECTION
+
+    def finish(self):
+        pass
+
+
+class _NullProfiler:
+    enabled = False
+
+    def rerun(self, step, name='rerun'):
+        return _NULL_RERUN
+
+    def cache_request(self, name):
+        pass
+
+    def cache_miss(self, name):
+        pass
+
+    def add_collector(self, collect):
+        pass
+
+
+_NULL_RERUN = _NullRerun()
+NULL_PROFILER = _NullProfiler()
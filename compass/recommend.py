@@ -0,0 +1,113 @@
+import numpy as np
+
+from compass.holland import HOLLAND_TYPES
+from compass.values import VALUE_COLUMNS
+
+# -----------------------------------------------------------------------------
+# 직업 추천 엔진 (STEP 3)
+# -----------------------------------------------------------------------------
+# 점수 = 100 - ||직업 가치관 - 사용자 가치관|| + 홀란드 보너스(1순위 5점, 2순위 3점)
+# 행 단위 apply 대신 전체 직업을 한 번에 계산하고, 상위 k개만 부분 선택합니다.
+#
+# 동점 규칙: 점수는 소수 9자리(SCORE_DECIMALS)로 반올림하고, 같은 점수는 원래 행 순서대로 둡니다.
+# 기존 calc_score(행별 np.linalg.norm + pandas 정렬)는 수학적으로 같은 거리의 직업도 부동소수 오차와
+# 정렬 알고리즘에 따라 순서가 갈렸으므로, 그 순서를 재현하는 대신 동점을 명시적으로 정의합니다.
+# (10점 단위 슬라이더 조합에서 정확히 같은 거리가 나오는 경우가 실제로 있음)
+
+FIRST_BONUS = 5
+SECOND_BONUS = 3
+SCORE_DECIMALS = 9
+
+
+def holland_mask(code):
+    """홀란드 코드 문자열을 RIASEC 비트마스크로 변환 (예: 'IR' -> I|R)"""
+    mask = 0
+    for letter in code:
+        idx = HOLLAND_TYPES.find(letter)
+        if idx >= 0:
+            mask |= 1 << idx
+    return mask
+
+
+def mask_bonus(mask, holland_code):
+    """비트마스크가 mask인 직업이 받는 홀란드 보너스"""
+    bonus = 0
+    if len(holland_code) > 0 and mask & holland_mask(holland_code[0]):
+        bonus += FIRST_BONUS
+    if len(holland_code) > 1 and mask & holland_mask(holland_code[1]):
+        bonus += SECOND_BONUS
+    return bonus
+
+
+def top_k_indices(scores, k):
+    """점수 상위 k개의 인덱스를 내림차순으로 반환 (동점은 원래 행 순서 유지)"""
+    n = scores.shape[0]
+    k = min(k, n)
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+    # 전체 정렬 없이 k번째 점수만 찾고, 그 이상인 후보만 정렬
+    kth = np.partition(scores, n - k)[n - k]
+    candidates = np.flatnonzero(scores >= kth)
+    order = np.argsort(-scores[candidates], kind='stable')
+    return candidates[order[:k]]
+
+
+def value_distance(values, user_vector):
+    """각 직업 가치관 벡터와 사용자 벡터 사이의 유클리드 거리"""
+    # float32 행렬 - float64 벡터 => float64 연산 (가치관 점수는 정수라 float32로 정확히 표현됨)
+    diff = values - np.asarray(user_vector, dtype=np.float64)
+    return np.sqrt(np.einsum('ij,ij->i', diff, diff))
+
+
+def job_scores(values, user_vector, bonus):
+    """추천 점수 (합산 순서에 따른 오차가 동점 순서를 바꾸지 않도록 SCORE_DECIMALS 자리로 반올림)"""
+    return np.round(100 - value_distance(values, user_vector) + bonus, SCORE_DECIMALS)
+
+
+class JobScorer:
+    def __init__(self, names, holland_codes, values, masks=None):
+        # 목록/튜플/배열(메모리 맵 포함)은 복사하지 않고 그대로 사용
+        self.names = names if isinstance(names, (list, tuple, np.ndarray)) else list(names)
+        self.holland_codes = holland_codes if isinstance(holland_codes, (list, tuple, np.ndarray)) else list(holland_codes)
+        # 가치관 5개 컬럼은 하나의 float32 행렬로 보관
+        self.values = np.ascontiguousarray(values, dtype=np.float32)
+        if masks is None:
+            masks = [holland_mask(c) for c in self.holland_codes]
+        self.masks = np.ascontiguousarray(masks, dtype=np.uint8)
+        # 여러 세션이 공유하므로 읽기 전용으로 고정
+        self.values.flags.writeable = False
+        self.masks.flags.writeable = False
+
+        if self.values.ndim != 2 or self.values.shape[1] != len(VALUE_COLUMNS):
+            raise ValueError(f"values must have shape (n, {len(VALUE_COLUMNS)})")
+        if not (len(self.names) == len(self.holland_codes) == self.values.shape[0]):
+            raise ValueError("names, holland_codes and values must have the same length")
+
+    @classmethod
+    def from_columns(cls, jobs):
+        """컬럼명 -> 값 목록 매핑(compass.data.JOBS 또는 df_jobs)으로부터 생성"""
+        values = np.column_stack([np.asarray(jobs[c], dtype=np.float32) for c in VALUE_COLUMNS])
+        return cls(jobs['직업군'], jobs['Holland_Code'], values)
+
+    def __len__(self):
+        return len(self.names)
+
+    def holland_bonus(self, holland_code):
+        bonus = np.zeros(len(self.names), dtype=np.float64)
+        if len(holland_code) > 0:
+            bonus += np.where(self.masks & holland_mask(holland_code[0]), FIRST_BONUS, 0)
+        if len(holland_code) > 1:
+            bonus += np.where(self.masks & holland_mask(holland_code[1]), SECOND_BONUS, 0)
+        return bonus
+
+    def scores(self, user_vector, holland_code):
+        return job_scores(self.values, user_vector, self.holland_bonus(holland_code))
+
+    def top_k(self, user_vector, holland_code, k=5):
+        return top_k_indices(self.scores(user_vector, holland_code), k)
+
+    def recommend(self, user_vector, holland_code, k=5):
+        """세션별 결과: (상위 k개 인덱스, 그 점수) - 공유 데이터에는 아무것도 쓰지 않음"""
+        scores = self.scores(user_vector, holland_code)
+        top = top_k_indices(scores, k)
+        return top, scores[top]
@@ -0,0 +1,30 @@
+from html import escape
+
+# -----------------------------------------------------------------------------
+# 정적 HTML 조각 (Streamlit 비의존, 프로세스당 한 번 만들어 재사용)
+# -----------------------------------------------------------------------------
+# 문항/전공/과목은 편집자가 고치는 data/ 파일(구글 시트 내보내기)에서 오므로 모든 값을 escape
+# (unsafe_allow_html로 그리므로 '<', '&' 하나로 화면이 깨지거나 임의의 HTML이 들어갈 수 있음)
+# 조각은 미리 만들어 캐시하므로 rerun마다 드는 비용은 없음
+
+PART_SIZE = 6  # 유형별 문항 수 (R, I, A, S, E, C 순서)
+
+
+def question_blocks(questions):
+    """STEP 1 문항별 HTML. 파트 첫 문항에는 'Part N' 헤더를 함께 넣어 요소 수를 줄임"""
+    blocks = []
+    for i, q in enumerate(questions):
+        header = f"<h3>📌 Part {i // PART_SIZE + 1}</h3>" if i % PART_SIZE == 0 else ""
+        blocks.append(f'{header}<div class="question-box"><b>Q{i+1}.</b> {escape(q["text"])}</div>')
+    return tuple(blocks)
+
+
+def guide_boxes(major, general_subjects, career_subjects):
+    """STEP 3 (전공 추천, 일반선택 과목, 진로선택 과목) info-box HTML"""
+    gen_tags = "".join([f"<span class='tag-base tag-gen'>{escape(s)}</span>" for s in general_subjects])
+    career_tags = "".join([f"<span class='tag-base tag-career'>{escape(s)}</span>" for s in career_subjects])
+    return (
+        f'<div class="info-box"><span class="info-title">🎓 대학 전공 추천</span><p>{escape(major)}</p></div>',
+        f'<div class="info-box"><span class="info-title">📘 고교 일반선택 과목</span>{gen_tags}</div>',
+        f'<div class="info-box"><span class="info-title">🚀 고교 진로선택 과목</span>{career_tags}</div>',
+    )
@@ -0,0 +1,267 @@
+import atexit
+import json
+import logging
+import queue
+import sqlite3
+import threading
+import time
+import weakref
+from collections import namedtuple
+
+from compass.holland import HOLLAND_TYPES
+from compass.values import VALUE_COLUMNS
+
+# -----------------------------------------------------------------------------
+# 검사 결과 저장소 (반별 리포트)
+# -----------------------------------------------------------------------------
+# STEP 3까지 마친 결과를 로컬 SQLite 파일에 쌓습니다.
+# rerun은 큐에 넣기만 하고(블로킹 없음), 백그라운드 스레드가 모아서 한 트랜잭션으로 기록합니다.
+# 기록할 때 반(cohort)별 집계 테이블도 함께 갱신하므로, 대시보드는 결과가 몇 건이든
+# 집계 행 몇 개만 읽습니다.
+#
+#   results        : 결과 1건 = 1행 (결과 id, 반, 홀란드 점수/코드, 가치관 벡터, 추천 직업, 선택 직업)
+#   cohort_totals  : 반별 인원수, RIASEC 점수 합계, 가치관 합계
+#   cohort_codes   : 반별 홀란드 코드 인원수
+#   cohort_jobs    : 반별 직업이 TOP 5에 추천된 횟수 / 최종 선택된 횟수
+
+log = logging.getLogger(__name__)
+
+SCORE_COLUMNS = [f"score_{t}" for t in HOLLAND_TYPES]
+VECTOR_COLUMNS = [f"value_{c}" for c in VALUE_COLUMNS]
+
+SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS results (
+    id TEXT PRIMARY KEY,
+    created REAL NOT NULL,
+    cohort TEXT NOT NULL,
+    holland_code TEXT NOT NULL,
+    {', '.join(f'{c} INTEGER NOT NULL' for c in SCORE_COLUMNS)},
+    {', '.join(f'{c} REAL NOT NULL' for c in VECTOR_COLUMNS)},
+    top_jobs TEXT NOT NULL,
+    selected_job TEXT
+);
+CREATE TABLE IF NOT EXISTS cohort_totals (
+    cohort TEXT PRIMARY KEY,
+    sessions INTEGER NOT NULL,
+    {', '.join(f'{c} INTEGER NOT NULL' for c in SCORE_COLUMNS)},
+    {', '.join(f'{c} REAL NOT NULL' for c in VECTOR_COLUMNS)}
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS cohort_codes (
+    cohort TEXT NOT NULL,
+    holland_code TEXT NOT NULL,
+    sessions INTEGER NOT NULL,
+    PRIMARY KEY (cohort, holland_code)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS cohort_jobs (
+    cohort TEXT NOT NULL,
+    job TEXT NOT NULL,
+    recommended INTEGER NOT NULL DEFAULT 0,
+    selected INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (cohort, job)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS cohort_jobs_recommended ON cohort_jobs (cohort, recommended DESC);
+"""
+
+# 대시보드용 반별 요약
+#   scores: 유형별 평균 점수, values: 가치관 평균 비율, codes: [(코드, 인원)], jobs: [(직업, 추천 횟수, 선택 횟수)]
+CohortSummary = namedtuple('CohortSummary', ['cohort', 'sessions', 'scores', 'values', 'codes', 'jobs'])
+
+
+def _insert_result(conn, result):
+    cohort = result['cohort']
+    scores = [int(result['holland_scores'][t]) for t in HOLLAND_TYPES]
+    vector = [float(v) for v in result['user_vector']]
+    conn.execute(
+        f"INSERT INTO results VALUES ({', '.join('?' * (len(SCORE_COLUMNS) + len(VECTOR_COLUMNS) + 6))})",
+        [result['id'], result.get('created', time.time()), cohort, result['holland_code'],
+         *scores, *vector, json.dumps(list(result['top_jobs']), ensure_ascii=False), result.get('selected_job')],
+    )
+    columns = SCORE_COLUMNS + VECTOR_COLUMNS
+    conn.execute(
+        f"INSERT INTO cohort_totals VALUES (?, 1, {', '.join('?' * len(columns))}) "
+        f"ON CONFLICT (cohort) DO UPDATE SET sessions = sessions + 1, "
+        + ', '.join(f"{c} = {c} + excluded.{c}" for c in columns),
+        [cohort, *scores, *vector],
+    )
+    conn.execute(
+        "INSERT INTO cohort_codes VALUES (?, ?, 1) "
+        "ON CONFLICT (cohort, holland_code) DO UPDATE SET sessions = sessions + 1",
+        (cohort, result['holland_code']),
+    )
+    conn.executemany(
+        "INSERT INTO cohort_jobs (cohort, job, recommended) VALUES (?, ?, 1) "
+        "ON CONFLICT (cohort, job) DO UPDATE SET recommended = recommended + 1",
+        [(cohort, job) for job in result['top_jobs']],
+    )
+    if result.get('selected_job') is not None:
+        _count_selected(conn, cohort, result['selected_job'], 1)
+
+
+def _count_selected(conn, cohort, job, delta):
+    conn.execute(
+        "INSERT INTO cohort_jobs (cohort, job, selected) VALUES (?, ?, ?) "
+        "ON CONFLICT (cohort, job) DO UPDATE SET selected = selected + excluded.selected",
+        (cohort, job, delta),
+    )
+
+
+def write_results(conn, batch):
+    """결과 묶음을 한 트랜잭션으로 기록 (이미 있는 결과 id는 선택 직업만 갱신)"""
+    with conn:
+        for result in batch:
+            row = conn.execute("SELECT cohort, selected_job FROM results WHERE id = ?", (result['id'],)).fetchone()
+            if row is None:
+                _insert_result(conn, result)
+                continue
+            cohort, previous = row
+            selected = result.get('selected_job')
+            if selected == previous:
+                continue
+            conn.execute("UPDATE results SET selected_job = ? WHERE id = ?", (selected, result['id']))
+            if previous is not None:
+                _count_selected(conn, cohort, previous, -1)
+            if selected is not None:
+                _count_selected(conn, cohort, selected, 1)
+
+
+_open_stores = weakref.WeakSet()
+
+
+def close_all():
+    """열려 있는 모든 저장소의 대기 결과를 기록하고 닫기 (프로세스 종료 시 자동 호출)"""
+    for store in list(_open_stores):
+        store.close()
+
+
+atexit.register(close_all)
+
+
+class ResultStore:
+    def __init__(self, path, batch_size=256, flush_interval=0.2, max_pending=100_000):
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue = queue.Queue(maxsize=max_pending)
+        conn = self._connect()
+        with conn:
+            conn.executescript(SCHEMA)
+        conn.close()
+        # 읽기(대시보드)용 연결 - WAL 모드라 기록 중에도 마지막으로 커밋된 상태를 읽을 수 있음
+        self._reader = self._connect()
+        self._read_lock = threading.Lock()
+        self.written = 0
+        self.batches = 0
+        self.dropped = 0
+        self.failed = 0
+        self._writer = threading.Thread(target=self._run, name='compass-results', daemon=True)
+        self._writer.start()
+        _open_stores.add(self)
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    # --- 기록 (write-behind) -------------------------------------------------
+
+    def submit(self, result):
+        """결과를 기록 대기열에 넣고 바로 반환
+
+        result: id, cohort, holland_code, holland_scores, user_vector, top_jobs, selected_job
+        같은 id를 다시 넣으면 selected_job만 갱신됩니다.
+        """
+        try:
+            self._queue.put_nowait(result)
+        except queue.Full:
+            self.dropped += 1
+            log.warning("result queue is full, dropping result %s", result.get('id'))
+
+    def _run(self):
+        conn = self._connect()
+        while True:
+            item = self._queue.get()
+            if item is None:
+                self._queue.task_done()
+                break
+            batch = [item]
+            stop = False
+            # 첫 결과가 들어온 뒤 flush_interval 동안(또는 batch_size까지) 모아서 한 번에 기록
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                try:
+                    item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                batch.append(item)
+            try:
+                self._write(conn, batch)
+            finally:
+                for _ in range(len(batch) + stop):
+                    self._queue.task_done()
+            if stop:
+                break
+        conn.close()
+
+    def _write(self, conn, batch):
+        try:
+            write_results(conn, batch)
+            self.written += len(batch)
+        except Exception:
+            # 묶음 전체가 롤백되므로 한 건씩 다시 기록해 문제 있는 결과만 버림
+            for result in batch:
+                try:
+                    write_results(conn, [result])
+                    self.written += 1
+                except Exception:
+                    self.failed += 1
+                    log.exception("failed to write result %s to %s", result.get('id'), self.path)
+        self.batches += 1
+
+    def flush(self):
+        """대기 중인 결과가 모두 기록될 때까지 대기"""
+        self._queue.join()
+
+    def close(self):
+        if self._writer.is_alive():
+            self._queue.put(None)
+            self._writer.join()
+        with self._read_lock:
+            self._reader.close()
+        _open_stores.discard(self)
+
+    # --- 대시보드 -------------------------------------------------------------
+
+    def _read(self, sql, params=()):
+        with self._read_lock:
+            return self._reader.execute(sql, params).fetchall()
+
+    def cohorts(self):
+        """[(반, 인원)] (반 이름 순)"""
+        return self._read("SELECT cohort, sessions FROM cohort_totals ORDER BY cohort")
+
+    def summary(self, cohort, top=10):
+        """반별 요약 (집계 테이블만 읽으므로 결과 건수와 무관). 결과가 없으면 None"""
+        rows = self._read(
+            f"SELECT sessions, {', '.join(SCORE_COLUMNS + VECTOR_COLUMNS)} FROM cohort_totals WHERE cohort = ?",
+            (cohort,),
+        )
+        if not rows:
+            return None
+        sessions, *totals = rows[0]
+        n_scores = len(SCORE_COLUMNS)
+        scores = {t: total / sessions for t, total in zip(HOLLAND_TYPES, totals[:n_scores])}
+        values = {c: total / sessions for c, total in zip(VALUE_COLUMNS, totals[n_scores:])}
+        codes = self._read(
+            "SELECT holland_code, sessions FROM cohort_codes WHERE cohort = ? ORDER BY sessions DESC, holland_code",
+            (cohort,),
+        )
+        jobs = self._read(
+            "SELECT job, recommended, selected FROM cohort_jobs WHERE cohort = ? ORDER BY recommended DESC LIMIT ?",
+            (cohort, top),
+        )
+        return CohortSummary(cohort, sessions, scores, values, codes, jobs)
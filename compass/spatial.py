@@ -0,0 +1,110 @@
+import numpy as np
+
+from compass.recommend import SCORE_DECIMALS, job_scores, mask_bonus, top_k_indices
+
+# -----------------------------------------------------------------------------
+# 가치관 벡터 최근접 이웃 인덱스 (STEP 3)
+# -----------------------------------------------------------------------------
+# 직업을 홀란드 비트마스크별로 나누고, 그룹마다 KD-트리 방식(가장 넓은 축의 중앙값 분할)으로
+# 잘게 쪼개 리프 버킷을 만듭니다. 같은 버킷 안에서는 홀란드 보너스가 상수이므로
+#   점수 상한 = 100 + 보너스 - (사용자 벡터 ~ 버킷 경계상자 최소거리)
+# 가 정확한 상한이 되고, k번째 점수보다 상한이 낮은 버킷은 열지 않습니다.
+# 결과는 JobScorer.top_k 전수 계산과 순서까지 동일합니다.
+
+# 부동소수 오차와 점수 반올림(SCORE_DECIMALS)으로 상한이 실제 점수보다 작게 나오는 것을 막는 여유분
+_BOUND_SLACK = 10.0 ** -SCORE_DECIMALS
+
+
+def kd_partition(points, leaf_size):
+    """points를 leaf_size 이하 버킷으로 분할 -> (재배열 순서, 버킷 경계 리스트)"""
+    perm = np.arange(len(points), dtype=np.intp)
+    bounds = []
+    stack = [(0, len(points))] if len(points) else []
+    while stack:
+        start, end = stack.pop()
+        if end - start <= leaf_size:
+            bounds.append((start, end))
+            continue
+        block = points[perm[start:end]]
+        axis = int(np.argmax(block.max(axis=0) - block.min(axis=0)))
+        mid = (end - start) // 2
+        perm[start:end] = perm[start:end][np.argpartition(block[:, axis], mid)]
+        stack.append((start + mid, end))
+        stack.append((start, start + mid))
+    return perm, bounds
+
+
+class ValueIndex:
+    def __init__(self, scorer, leaf_size=None, brute_force_below=0):
+        self.scorer = scorer
+        self.names = scorer.names
+        self.brute_force_below = brute_force_below
+        if leaf_size is None:
+            # 버킷 수(상한 계산)와 버킷 크기(점수 계산) 사이의 균형점
+            leaf_size = int(np.clip(np.sqrt(len(scorer)) / 4, 32, 256))
+        self.leaf_size = leaf_size
+
+        order, starts, ends, masks = [], [], [], []
+        offset = 0
+        for mask in np.unique(scorer.masks):
+            members = np.flatnonzero(scorer.masks == mask)
+            perm, bounds = kd_partition(scorer.values[members], leaf_size)
+            order.append(members[perm])
+            for start, end in bounds:
+                starts.append(offset + start)
+                ends.append(offset + end)
+                masks.append(int(mask))
+            offset += len(members)
+
+        # 버킷이 연속 구간이 되도록 직업을 재배열해 보관
+        self.job_ids = np.concatenate(order) if order else np.empty(0, dtype=np.intp)
+        self.points = scorer.values[self.job_ids]
+        self.leaf_start = np.array(starts, dtype=np.intp)
+        self.leaf_end = np.array(ends, dtype=np.intp)
+        self.leaf_mask = np.array(masks, dtype=np.uint8)
+        self.leaf_lo = np.array([self.points[s:e].min(axis=0) for s, e in zip(starts, ends)], dtype=np.float64).reshape(-1, 5)
+        self.leaf_hi = np.array([self.points[s:e].max(axis=0) for s, e in zip(starts, ends)], dtype=np.float64).reshape(-1, 5)
+        self.mask_values = sorted(set(masks))
+        for array in (self.job_ids, self.points, self.leaf_start, self.leaf_end, self.leaf_mask, self.leaf_lo, self.leaf_hi):
+            array.flags.writeable = False
+
+    def __len__(self):
+        return len(self.scorer)
+
+    def top_k(self, user_vector, holland_code, k=5):
+        # 직업 수가 brute_force_below 미만이면 전수 계산 (기준값은 compass.catalog.INDEX_MIN_JOBS)
+        if len(self.scorer) < self.brute_force_below or k <= 0:
+            return self.scorer.top_k(user_vector, holland_code, k)
+
+        query = np.asarray(user_vector, dtype=np.float64)
+        bonus = np.zeros(len(self.leaf_mask), dtype=np.float64)
+        for mask in self.mask_values:
+            bonus[self.leaf_mask == mask] = mask_bonus(mask, holland_code)
+        gap = np.maximum(self.leaf_lo - query, 0) + np.maximum(query - self.leaf_hi, 0)
+        upper = 100 + bonus - np.sqrt(np.einsum('ij,ij->i', gap, gap)) + _BOUND_SLACK
+
+        # 1단계: 상한이 가장 높은 버킷 k개(직업 k명 이상)만 열어 k번째 점수의 하한을 구함
+        n_first = min(k, len(upper))
+        first = np.argpartition(-upper, n_first - 1)[:n_first]
+        first_scores = self._leaf_scores(first, query, bonus)[1]
+        if len(first_scores) >= k:
+            threshold = np.partition(first_scores, len(first_scores) - k)[len(first_scores) - k]
+        else:
+            threshold = -np.inf
+
+        # 2단계: 상한이 그 값 이상인 버킷만 한 번에 계산 (나머지는 top-k에 들 수 없음)
+        ids, scores = self._leaf_scores(np.flatnonzero(upper >= threshold), query, bonus)
+        by_row = np.argsort(ids, kind='stable')
+        return ids[by_row[top_k_indices(scores[by_row], k)]]
+
+    def recommend(self, user_vector, holland_code, k=5):
+        """세션별 결과: (상위 k개 인덱스, 그 점수) - 공유 데이터에는 아무것도 쓰지 않음"""
+        top = self.top_k(user_vector, holland_code, k)
+        bonus = np.array([mask_bonus(m, holland_code) for m in self.scorer.masks[top].tolist()], dtype=np.float64)
+        return top, job_scores(self.scorer.values[top], user_vector, bonus)
+
+    def _leaf_scores(self, leaves, query, bonus):
+        starts, ends = self.leaf_start[leaves], self.leaf_end[leaves]
+        rows = np.concatenate([np.arange(s, e) for s, e in zip(starts.tolist(), ends.tolist())])
+        leaf_bonus = np.repeat(bonus[leaves], ends - starts)
+        return self.job_ids[rows], job_scores(self.points[rows], query, leaf_bonus)
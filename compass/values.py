@@ -0,0 +1,13 @@
+# -----------------------------------------------------------------------------
+# 직업 가치관 (STEP 2 슬라이더)
+# -----------------------------------------------------------------------------
+
+VALUE_COLUMNS = ['Money', 'WLB', 'Culture', 'Location', 'Stability']
+DEFAULT_WEIGHTS = (50, 50, 20, 30, 50)  # STEP 2 슬라이더 기본값
+
+
+def normalize_weights(weights):
+    """슬라이더 값(0~100) 5개를 합계 100 기준 비율로 변환"""
+    total = sum(weights)
+    if total == 0: total = 1
+    return [(x/total)*100 for x in weights]
@@ -0,0 +1,81 @@
+import shutil
+
+import pytest
+
+from compass.catalog import INDEX_MIN_JOBS
+from compass.loader import SOURCE_FILES, CatalogStore, load_catalog, source_signature
+
+# 데이터 파일 검증 / 핫 리로드 (저장소 루트에서 python -m pytest -q)
+#   잘못된 카탈로그는 불러오는 시점에 ValueError로 거부되어야 하고 (세션마다 화면이 깨지지 않도록),
+#   핫 리로드 중에 거부되면 이전 카탈로그가 그대로 유지되어야 합니다.
+
+QUESTIONS_HEADER = "id,text,type\n"
+JOBS_HEADER = "직업군,Holland_Code,Money,WLB,Culture,Location,Stability\n"
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    for name in SOURCE_FILES:
+        shutil.copy(f"data/{name}", tmp_path / name)
+    return tmp_path
+
+
+def write(path, text):
+    path.write_text(text, encoding='utf-8')
+
+
+def test_data_files_load(data_dir):
+    catalog = load_catalog(data_dir)
+    assert len(catalog) == 30
+    assert len(catalog.questions) == 36
+
+
+@pytest.mark.parametrize('name, text, message', [
+    ('questions.csv', QUESTIONS_HEADER + "Q1,first,R\nQ1,second,I\n", "duplicate question id 'Q1'"),
+    ('questions.csv', QUESTIONS_HEADER + "Q1,first,R\n,second,I\n", "missing question id"),
+    ('questions.csv', QUESTIONS_HEADER, "no questions"),
+    ('questions.csv', "", "missing column id, text, type"),
+    ('questions.csv', "id,type\nQ1,R\n", "missing column text"),
+    ('jobs.csv', JOBS_HEADER, "no jobs"),
+    ('jobs.csv', JOBS_HEADER + "PD,AS,1,2,3,4,5\nPD,AE,1,2,3,4,5\n", "duplicate job name 'PD'"),
+    ('jobs.csv', JOBS_HEADER + ",AS,1,2,3,4,5\n", "missing job name"),
+    ('jobs.csv', "직업군,Holland_Code,Money\nPD,AS,1\n", "missing column WLB, Culture, Location, Stability"),
+])
+def test_invalid_catalog_is_rejected(data_dir, name, text, message):
+    write(data_dir / name, text)
+    for use_cache in (True, False):
+        with pytest.raises(ValueError, match=message):
+            load_catalog(data_dir, use_cache=use_cache)
+
+
+def test_failed_reload_keeps_previous_catalog(data_dir):
+    store = CatalogStore(data_dir)
+    previous = store.get()
+    write(data_dir / 'jobs.csv', JOBS_HEADER)
+    store._reloading.acquire()
+    store._reload(source_signature(data_dir))
+    assert store.get() is previous
+    assert store.reloads == 0
+
+    # 파일을 고치면 다음 리로드에서 교체됨
+    write(data_dir / 'jobs.csv', JOBS_HEADER + "PD,AS,1,2,3,4,5\n")
+    store._reloading.acquire()
+    store._reload(source_signature(data_dir))
+    assert store.get() is not previous
+    assert len(store.get()) == 1
+    assert store.reloads == 1
+
+
+def test_large_catalog_index_is_built_on_load(data_dir):
+    store = CatalogStore(data_dir)
+    # 작은 카탈로그는 STEP 3에서 처음 필요할 때 생성
+    assert store.get()._recommender is None
+
+    rows = [f"직업 {i},{'RIASEC'[i % 6]},{i % 50},{i % 7},{i % 11},{i % 13},{i % 17}\n" for i in range(INDEX_MIN_JOBS)]
+    write(data_dir / 'jobs.csv', JOBS_HEADER + ''.join(rows))
+    store._reloading.acquire()
+    store._reload(source_signature(data_dir))
+    catalog = store.get()
+    assert len(catalog) == INDEX_MIN_JOBS
+    assert catalog._recommender is not None
+    assert catalog.recommender().brute_force_below == INDEX_MIN_JOBS
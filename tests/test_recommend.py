@@ -0,0 +1,103 @@
+import itertools
+
+import numpy as np
+import pytest
+
+from compass.data import JOBS
+from compass.holland import HOLLAND_CODES
+from compass.recommend import SCORE_DECIMALS, JobScorer
+from compass.spatial import ValueIndex
+from compass.values import VALUE_COLUMNS, normalize_weights
+
+# 추천 순위 검증 (저장소 루트에서 python -m pytest -q)
+#   - ValueIndex 버킷 탐색이 JobScorer.top_k 전수 계산과 순서까지 같은지 (동점이 많은 가상 카탈로그)
+#   - 기본 30개 직업의 순위가 기존 app.py calc_score 공식과 같은지 (동점 규칙은 compass.recommend 참고)
+
+TIE_LEVELS = np.array([10, 20, 30, 40, 50], dtype=np.float32)
+
+
+def tied_catalog(n, seed):
+    """가치관이 5단계 값뿐이라 점수 동점이 많은 가상 카탈로그"""
+    rng = np.random.default_rng(seed)
+    codes = [HOLLAND_CODES[i] for i in rng.integers(0, len(HOLLAND_CODES), n)]
+    values = rng.choice(TIE_LEVELS, size=(n, 5))
+    return JobScorer([f"job {i}" for i in range(n)], codes, values)
+
+
+def tied_users(n, seed):
+    """카탈로그와 같은 단계 값을 쓰는 사용자 벡터 (거리가 정확히 같은 직업이 많음)"""
+    rng = np.random.default_rng(seed)
+    return [
+        (HOLLAND_CODES[rng.integers(0, len(HOLLAND_CODES))], rng.choice(TIE_LEVELS, size=5).astype(float).tolist())
+        for _ in range(n)
+    ]
+
+
+@pytest.mark.parametrize('size', [9_000, 16_384, 30_000])
+def test_value_index_matches_brute_force(size):
+    scorer = tied_catalog(size, seed=size)
+    # brute_force_below=0: 크기와 상관없이 항상 버킷 탐색 경로를 검사
+    index = ValueIndex(scorer, brute_force_below=0)
+    for code, vector in tied_users(200, seed=size + 1):
+        for k in (1, 5, 50):
+            expected = scorer.top_k(vector, code, k)
+            np.testing.assert_array_equal(index.top_k(vector, code, k), expected, err_msg=f"{code} {vector} k={k}")
+
+
+def original_value_match(jobs, user_vector):
+    """기존 app.py calc_score의 가치관 점수 (직업 한 행씩 np.linalg.norm)"""
+    user_vec = np.array(user_vector)
+    return [
+        float(100 - np.linalg.norm(np.array([jobs[c][i] for c in VALUE_COLUMNS]) - user_vec))
+        for i in range(len(jobs['Holland_Code']))
+    ]
+
+
+def original_scores(jobs, holland_code, value_match):
+    """기존 calc_score의 홀란드 보너스를 더한 점수"""
+    scores = []
+    for match, job_code in zip(value_match, jobs['Holland_Code']):
+        holland_bonus = 0
+        if holland_code[0] in job_code: holland_bonus += 5
+        if holland_code[1] in job_code: holland_bonus += 3
+        scores.append(match + holland_bonus)
+    return scores
+
+
+def reference_top5(scores):
+    """동점 규칙: 소수 9자리로 반올림한 점수 내림차순, 같은 점수는 행 순서"""
+    rounded = [round(score, SCORE_DECIMALS) for score in scores]
+    return sorted(range(len(rounded)), key=lambda i: -rounded[i])[:5]
+
+
+def slider_weights():
+    """50점 단위 슬라이더 격자 전체 + 10점 단위 격자에서 뽑은 조합 + 동점이 나오는 알려진 조합"""
+    grid = [tuple(w) for w in itertools.product(range(0, 101, 50), repeat=5)]
+    rng = np.random.default_rng(0)
+    grid += [tuple(w) for w in (rng.integers(0, 11, size=(600, 5)) * 10).tolist()]
+    # 방송 PD / 웹툰 작가의 거리 제곱이 정확히 293225/162로 같은 경우 (AR)
+    grid.append((18, 75, 49, 58, 16))
+    return grid
+
+
+def test_builtin_ranking_matches_original_formula():
+    scorer = JobScorer.from_columns(JOBS)
+    ties = 0
+    for weights in slider_weights():
+        user_vector = normalize_weights(weights)
+        value_match = original_value_match(JOBS, user_vector)
+        for code in HOLLAND_CODES:
+            scores = original_scores(JOBS, code, value_match)
+            expected = reference_top5(scores)
+            assert scorer.top_k(user_vector, code, 5).tolist() == expected, (weights, code)
+            top = [round(scores[i], SCORE_DECIMALS) for i in expected]
+            ties += len(set(top)) < len(top)
+    # 표본에 실제 동점 사례가 들어 있어야 동점 규칙을 검사하는 의미가 있음
+    assert ties > 0
+
+
+def test_exact_tie_keeps_row_order():
+    scorer = JobScorer.from_columns(JOBS)
+    names = list(JOBS['직업군'])
+    top = [names[i] for i in scorer.top_k(normalize_weights((18, 75, 49, 58, 16)), 'AR', 5)]
+    assert top.index('방송 PD') + 1 == top.index('웹툰 작가')
@@ -0,0 +1,16 @@
+from compass.render import guide_boxes, question_blocks
+
+# 편집자가 고치는 데이터 값은 HTML로 해석되지 않아야 함 (저장소 루트에서 python -m pytest -q)
+
+
+def test_question_text_is_escaped():
+    block, = question_blocks([{'id': 'Q1', 'text': '<script>x</script> R&D', 'type': 'R'}])
+    assert '<script>' not in block
+    assert '&lt;script&gt;x&lt;/script&gt; R&amp;D' in block
+
+
+def test_guide_fields_are_escaped():
+    major, general, career = guide_boxes('<b>전공</b>', ['A&B'], ['<img src=x onerror=alert(1)>'])
+    assert '&lt;b&gt;전공&lt;/b&gt;' in major
+    assert "<span class='tag-base tag-gen'>A&amp;B</span>" in general
+    assert '<img' not in career
@@ -0,0 +1,103 @@
+import sqlite3
+
+import pytest
+
+from compass.holland import HOLLAND_TYPES
+from compass.results import SCHEMA, ResultStore, write_results
+
+# 검사 결과 저장 / 반별 집계 (저장소 루트에서 python -m pytest -q)
+
+
+def make_result(rid, cohort='3-2', code='IR', scores=None, vector=(20, 20, 20, 20, 20), top_jobs=('A', 'B'), selected=None):
+    return {
+        'id': rid,
+        'cohort': cohort,
+        'holland_code': code,
+        'holland_scores': scores or {t: 10 for t in HOLLAND_TYPES},
+        'user_vector': list(vector),
+        'top_jobs': list(top_jobs),
+        'selected_job': selected,
+    }
+
+
+@pytest.fixture
+def conn():
+    conn = sqlite3.connect(':memory:')
+    conn.executescript(SCHEMA)
+    yield conn
+    conn.close()
+
+
+def jobs(conn, cohort='3-2'):
+    """{직업: (추천 횟수, 선택 횟수)}"""
+    rows = conn.execute("SELECT job, recommended, selected FROM cohort_jobs WHERE cohort = ?", (cohort,))
+    return {job: (recommended, selected) for job, recommended, selected in rows}
+
+
+def test_first_insert_updates_all_aggregates(conn):
+    write_results(conn, [make_result('r1', selected='A')])
+    assert conn.execute("SELECT COUNT(*) FROM results").fetchone() == (1,)
+    assert conn.execute("SELECT sessions, score_R, value_Money FROM cohort_totals").fetchall() == [(1, 10, 20.0)]
+    assert conn.execute("SELECT holland_code, sessions FROM cohort_codes").fetchall() == [('IR', 1)]
+    assert jobs(conn) == {'A': (1, 1), 'B': (1, 0)}
+
+
+def test_reselection_moves_selected_count(conn):
+    write_results(conn, [make_result('r1', selected='A')])
+    write_results(conn, [make_result('r1', selected='B')])
+    assert jobs(conn) == {'A': (1, 0), 'B': (1, 1)}
+    # 선택 해제 / 같은 선택 다시 저장
+    write_results(conn, [make_result('r1', selected=None)])
+    assert jobs(conn) == {'A': (1, 0), 'B': (1, 0)}
+    write_results(conn, [make_result('r1', selected='A'), make_result('r1', selected='A')])
+    assert jobs(conn) == {'A': (1, 1), 'B': (1, 0)}
+    # 다시 저장해도 인원/추천 횟수는 한 번만 집계
+    assert conn.execute("SELECT sessions FROM cohort_totals").fetchone() == (1,)
+    assert conn.execute("SELECT selected_job FROM results WHERE id = 'r1'").fetchone() == ('A',)
+
+
+def test_duplicate_ids_in_one_batch(conn):
+    write_results(conn, [make_result('r1'), make_result('r1', selected='B'), make_result('r2', selected='A')])
+    assert conn.execute("SELECT COUNT(*) FROM results").fetchone() == (2,)
+    assert conn.execute("SELECT sessions FROM cohort_totals").fetchone() == (2,)
+    assert conn.execute("SELECT sessions FROM cohort_codes").fetchone() == (2,)
+    assert jobs(conn) == {'A': (2, 1), 'B': (2, 1)}
+
+
+def test_bad_row_is_dropped_and_rest_of_batch_commits(tmp_path):
+    # 한 묶음으로 기록되도록 batch_size/flush_interval을 충분히 크게
+    store = ResultStore(str(tmp_path / 'results.sqlite'), batch_size=100, flush_interval=0.5)
+    try:
+        # results / cohort_totals 기록 뒤 cohort_jobs에서 실패 (NOT NULL) -> 이 결과의 집계도 남지 않아야 함
+        bad = make_result('bad', cohort='bad', top_jobs=('A', None))
+        for result in [make_result('r1'), bad, make_result('r2', cohort='3-3')]:
+            store.submit(result)
+        store.flush()
+        assert (store.written, store.failed, store.batches) == (2, 1, 1)
+        assert store.cohorts() == [('3-2', 1), ('3-3', 1)]
+    finally:
+        store.close()
+
+
+def test_summary_averages(tmp_path):
+    store = ResultStore(str(tmp_path / 'results.sqlite'), flush_interval=0)
+    try:
+        first = {t: 10 for t in HOLLAND_TYPES}
+        second = {t: 20 for t in HOLLAND_TYPES}
+        second['A'] = 40
+        store.submit(make_result('r1', code='IR', scores=first, vector=(40, 10, 10, 10, 30), top_jobs=('A', 'B'), selected='A'))
+        store.submit(make_result('r2', code='AS', scores=second, vector=(20, 30, 10, 10, 30), top_jobs=('A', 'C')))
+        store.submit(make_result('r3', cohort='other', code='AS'))
+        store.flush()
+
+        summary = store.summary('3-2')
+        assert summary.sessions == 2
+        assert summary.scores['R'] == 15
+        assert summary.scores['A'] == 25
+        assert summary.values == {'Money': 30, 'WLB': 20, 'Culture': 10, 'Location': 10, 'Stability': 30}
+        assert sorted(summary.codes) == [('AS', 1), ('IR', 1)]
+        assert summary.jobs[0] == ('A', 2, 1)
+        assert sorted(summary.jobs[1:]) == [('B', 1, 0), ('C', 1, 0)]
+        assert store.summary('nobody') is None
+    finally:
+        store.close()